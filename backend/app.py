@@ -1,9 +1,17 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Header, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Optional
 import json
 import os
+import threading
+
+from catalog_watcher import CatalogWatcher
+from scoring_executor import ScoringExecutor, ExecutorSaturated, server_timing
+from precompressed import VersionedResponse, serve_versioned
+from career_store import CareerStore
+from facet_index import FacetIndex
 
 app = FastAPI(title="Pathway AI Backend", version="1.0.0")
 
@@ -40,17 +48,88 @@ class RecommendationResponse(BaseModel):
     total_careers_analyzed: int
     user_profile: UserAssessment
 
+CAREERS_FILE = "careers.json"
+
+# Seconds between checks of careers.json for changes (0 disables the watcher)
+CAREERS_RELOAD_INTERVAL = float(os.getenv("CAREERS_RELOAD_INTERVAL", "5"))
+
+# When set, /admin endpoints require a matching X-Admin-Token header
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+
 # Load careers data
 def load_careers_data():
     try:
-        if os.path.exists("careers.json"):
-            with open("careers.json", "r", encoding="utf-8") as file:
+        if os.path.exists(CAREERS_FILE):
+            with open(CAREERS_FILE, "r", encoding="utf-8") as file:
                 return json.load(file)
         return []
     except Exception:
         return []
 
+def _careers_stamp():
+    # (mtime, size) of careers.json, used to tell its versions apart
+    try:
+        stat = os.stat(CAREERS_FILE)
+    except OSError:
+        return None
+    return stat.st_mtime, stat.st_size
+
 careers_data = load_careers_data()
+catalog_facets = FacetIndex.build(CareerStore(careers_data))
+catalog_version = 1
+# Stamp of the careers.json this process loaded last
+catalog_stamp = _careers_stamp()
+_reload_lock = threading.Lock()
+
+def reload_careers_data() -> bool:
+    # Swap the whole list in one assignment; handlers take a local reference
+    # first so a request never mixes two versions. A bad file keeps the old list.
+    global careers_data, catalog_facets, catalog_version, catalog_stamp
+    with _reload_lock:
+        try:
+            new_stamp = _careers_stamp()
+            with open(CAREERS_FILE, "r", encoding="utf-8") as file:
+                new_careers = json.load(file)
+            new_facets = FacetIndex.build(CareerStore(new_careers))
+        except Exception as e:
+            print(f"Error reloading careers data: {e}")
+            return False
+        careers_data = new_careers
+        catalog_facets = new_facets
+        catalog_version += 1
+        catalog_stamp = new_stamp
+        return True
+
+catalog_watcher = CatalogWatcher(lambda: CAREERS_FILE, reload_careers_data, CAREERS_RELOAD_INTERVAL)
+
+# True in scoring worker processes, which load their own copy of careers.json
+_in_scoring_worker = False
+
+def _init_scoring_worker():
+    # Workers follow the parent's catalog through the stamp passed with each job
+    global _in_scoring_worker
+    _in_scoring_worker = True
+
+# Scoring runs in a "thread" or "process" pool so the event loop stays free;
+# beyond SCORING_QUEUE_SIZE requests in flight, new ones get a 503
+SCORING_EXECUTOR = os.getenv("SCORING_EXECUTOR", "thread")
+scoring_executor = ScoringExecutor(
+    kind=SCORING_EXECUTOR,
+    max_workers=int(os.getenv("SCORING_WORKERS", "0")) or None,
+    max_pending=int(os.getenv("SCORING_QUEUE_SIZE", "64")),
+    initializer=_init_scoring_worker if SCORING_EXECUTOR == "process" else None
+)
+
+@app.on_event("startup")
+async def start_catalog_watcher():
+    if CAREERS_RELOAD_INTERVAL > 0:
+        catalog_watcher.start()
+    await run_in_threadpool(scoring_executor.warm_up)
+
+@app.on_event("shutdown")
+async def stop_catalog_watcher():
+    catalog_watcher.stop()
+    scoring_executor.shutdown()
 
 # Add explicit OPTIONS handlers for CORS preflight requests
 @app.options("/")
@@ -59,6 +138,8 @@ careers_data = load_careers_data()
 @app.options("/api/careers")
 @app.options("/api/categories")
 @app.options("/api/skills")
+@app.options("/api/facets")
+@app.options("/admin/reload")
 async def options_handler():
     return {"message": "OK"}
 
@@ -70,72 +151,119 @@ async def root():
 async def health_check():
     return {"status": "healthy", "message": "Backend is running", "careers_loaded": len(careers_data)}
 
+def score_assessment(parent_stamp, user_assessment: UserAssessment) -> RecommendationResponse:
+    # CPU-bound; runs in the scoring executor. Reloads in the parent do not reach
+    # worker processes, so a worker whose catalog differs from the parent's
+    # reloads first, unless the file on disk is still the one it has.
+    if _in_scoring_worker and parent_stamp != catalog_stamp and _careers_stamp() != catalog_stamp:
+        reload_careers_data()
+    careers = careers_data
+    recommendations = []
+    for career in careers:
+        matched_skills = []
+        missing_skills = []
+        
+        for skill in career.get("required_skills", []):
+            if skill.lower() in [s.lower() for s in user_assessment.skills]:
+                matched_skills.append(skill)
+            else:
+                missing_skills.append(skill)
+        
+        total_skills = len(career.get("required_skills", []))
+        match_score = len(matched_skills) / total_skills if total_skills > 0 else 0.0
+        
+        if career.get("category", "").lower() in [c.lower() for c in user_assessment.preferred_categories]:
+            match_score += 0.1
+        
+        match_score = min(1.0, max(0.0, match_score))
+        
+        recommendations.append(CareerRecommendation(
+            id=career.get("id", 0),
+            title=career.get("title", ""),
+            category=career.get("category", ""),
+            description=career.get("description", ""),
+            match_score=round(match_score, 3),
+            matched_skills=matched_skills,
+            missing_skills=missing_skills,
+            experience_level=career.get("experience_level", ""),
+            salary_range=career.get("salary_range", ""),
+            education=career.get("education", "")
+        ))
+    
+    recommendations.sort(key=lambda x: x.match_score, reverse=True)
+    
+    return RecommendationResponse(
+        recommendations=recommendations[:3],
+        total_careers_analyzed=len(careers),
+        user_profile=user_assessment
+    )
+
 @app.post("/recommend", response_model=RecommendationResponse)
-async def get_recommendations(user_assessment: UserAssessment):
+async def get_recommendations(user_assessment: UserAssessment, response: Response):
     try:
         if not user_assessment.skills and not user_assessment.interests:
             raise HTTPException(status_code=400, detail="At least one skill or interest must be provided")
         
-        recommendations = []
-        for career in careers_data:
-            matched_skills = []
-            missing_skills = []
-            
-            for skill in career.get("required_skills", []):
-                if skill.lower() in [s.lower() for s in user_assessment.skills]:
-                    matched_skills.append(skill)
-                else:
-                    missing_skills.append(skill)
-            
-            total_skills = len(career.get("required_skills", []))
-            match_score = len(matched_skills) / total_skills if total_skills > 0 else 0.0
-            
-            if career.get("category", "").lower() in [c.lower() for c in user_assessment.preferred_categories]:
-                match_score += 0.1
-            
-            match_score = min(1.0, max(0.0, match_score))
-            
-            recommendations.append(CareerRecommendation(
-                id=career.get("id", 0),
-                title=career.get("title", ""),
-                category=career.get("category", ""),
-                description=career.get("description", ""),
-                match_score=round(match_score, 3),
-                matched_skills=matched_skills,
-                missing_skills=missing_skills,
-                experience_level=career.get("experience_level", ""),
-                salary_range=career.get("salary_range", ""),
-                education=career.get("education", "")
-            ))
-        
-        recommendations.sort(key=lambda x: x.match_score, reverse=True)
-        
-        return RecommendationResponse(
-            recommendations=recommendations[:3],
-            total_careers_analyzed=len(careers_data),
-            user_profile=user_assessment
-        )
+        try:
+            result, queue_seconds, compute_seconds = await scoring_executor.run(score_assessment, catalog_stamp, user_assessment)
+        except ExecutorSaturated:
+            raise HTTPException(status_code=503, detail="Server is busy, please retry shortly", headers={"Retry-After": "1"})
+        response.headers["Server-Timing"] = server_timing(queue_seconds, compute_seconds)
+        return result
         
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating recommendations: {str(e)}")
 
+@app.post("/admin/reload")
+async def reload_careers(x_admin_token: Optional[str] = Header(None)):
+    if ADMIN_TOKEN and x_admin_token != ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+    if not await run_in_threadpool(reload_careers_data):
+        raise HTTPException(status_code=500, detail="Error reloading careers data, the previous catalog is still being served")
+    return {"status": "reloaded", "total_count": len(careers_data)}
+
+# Catalog listings are serialized and compressed once per catalog version.
+# The version is read before the list: a reload in between only causes an
+# extra rebuild, never an old list cached under the new version.
+careers_response = VersionedResponse()
+categories_response = VersionedResponse()
+skills_response = VersionedResponse()
+
 @app.get("/api/careers")
-async def get_all_careers():
-    return {"careers": careers_data, "total_count": len(careers_data)}
+async def get_all_careers(request: Request):
+    version, careers = catalog_version, careers_data
+    return await serve_versioned(request, careers_response, version,
+                                 lambda: {"careers": careers, "total_count": len(careers)})
 
+# Categories and skills come from the facet index built when the catalog loads
 @app.get("/api/categories")
-async def get_career_categories():
-    categories = list(set(career.get("category", "") for career in careers_data if career.get("category")))
-    return {"categories": sorted(categories), "total_count": len(categories)}
+async def get_career_categories(request: Request):
+    version, facets = catalog_version, catalog_facets
+    counts = facets.category_counts
+    return await serve_versioned(request, categories_response, version,
+                                 lambda: {"categories": list(counts), "total_count": len(counts), "counts": counts})
 
 @app.get("/api/skills")
-async def get_all_skills():
-    all_skills = set()
-    for career in careers_data:
-        all_skills.update(career.get("required_skills", []))
-    return {"skills": sorted(list(all_skills)), "total_count": len(all_skills)}
+async def get_all_skills(request: Request, category: Optional[str] = None):
+    version, facets = catalog_version, catalog_facets
+    counts = facets.skills(category)
+    if category is not None:
+        return {"skills": list(counts), "total_count": len(counts), "counts": counts}
+    return await serve_versioned(request, skills_response, version,
+                                 lambda: {"skills": list(counts), "total_count": len(counts), "counts": counts})
+
+@app.get("/api/facets")
+async def get_facets(category: Optional[str] = None):
+    facets = catalog_facets
+    return {
+        "category": category,
+        "total_careers": facets.category_counts.get(category, 0) if category is not None else facets.total_careers,
+        "categories": facets.category_counts,
+        "skills": facets.skills(category),
+        "experience_levels": facets.experience_levels(category)
+    }
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,303 @@
+"""
+Career Index Module
+Compiles the careers catalog into normalized skill IDs and inverted indexes
+so recommendation requests only visit careers that can actually match.
+"""
+
+from array import array
+from typing import List, Dict, Any, Callable, Optional, Sequence, Set, Tuple
+from dataclasses import dataclass
+
+import numpy as np
+
+from career_store import CareerStore, to_array
+from skill_matcher import SkillMatcher, SkillCorrector
+
+# Experience level keywords and their seniority rank
+EXPERIENCE_RANKS = {"entry": 1, "junior": 1, "mid": 2, "senior": 3, "lead": 4, "principal": 5}
+
+
+def parse_experience_level(experience_lower: str) -> int:
+    """
+    Highest seniority rank mentioned in a lowercase experience level.
+
+    "entry to senior" parses to 3; text without a known level to 0.
+    """
+    return max((rank for level, rank in EXPERIENCE_RANKS.items() if level in experience_lower), default=0)
+
+
+@dataclass(frozen=True)
+class SkillBlocks:
+    """
+    Every skill's posting list split into blocks of careers that share a
+    (category, experience level) group and a number of required skills.
+
+    Blocks of skill s are indptr[s]:indptr[s + 1]; the careers of block b
+    are positions[offsets[b]:offsets[b + 1]], all requiring totals[b] skills
+    of which at most max_occurrences[b] are this skill. Matching the skill
+    exactly therefore adds at most max_occurrences[b] / totals[b] to a
+    block career's skill score, and matching it partially 1 / totals[b].
+    """
+    indptr: np.ndarray
+    groups: np.ndarray
+    totals: np.ndarray
+    offsets: np.ndarray
+    positions: np.ndarray
+    max_occurrences: np.ndarray
+
+    @classmethod
+    def build(cls, skill_offsets: array, skill_ids: array, career_groups: np.ndarray,
+              num_skills: int) -> "SkillBlocks":
+        """Split the posting lists of the careers' skills by group and skill count."""
+        offsets = np.frombuffer(skill_offsets, dtype=np.int64)
+        career_totals = np.diff(offsets)
+        num_careers = max(career_totals.size, 1)
+        careers = np.repeat(np.arange(career_totals.size, dtype=np.int64), career_totals)
+        keys, occurrences = np.unique(
+            np.frombuffer(skill_ids, dtype=np.int32).astype(np.int64) * num_careers + careers,
+            return_counts=True
+        )
+        skills, careers = np.divmod(keys, num_careers)
+        groups = career_groups[careers]
+        totals = career_totals[careers]
+        order = np.lexsort((careers, totals, groups, skills))
+        skills, groups, totals = skills[order], groups[order], totals[order]
+        careers, occurrences = careers[order], occurrences[order]
+
+        starts = np.flatnonzero(np.diff(skills) | np.diff(groups) | np.diff(totals)) + 1
+        starts = np.concatenate([[0], starts]).astype(np.int64) if skills.size else starts
+        return cls(
+            indptr=np.searchsorted(skills[starts], np.arange(num_skills + 1)),
+            groups=groups[starts].astype(np.int32),
+            totals=totals[starts].astype(np.int32),
+            offsets=np.append(starts, skills.size).astype(np.int64),
+            positions=careers.astype(np.int32),
+            max_occurrences=(
+                np.maximum.reduceat(occurrences, starts).astype(np.int32) if starts.size
+                else np.empty(0, dtype=np.int32)
+            ),
+        )
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "SkillBlocks":
+        """Blocks restored from to_arrays output, without copying."""
+        return cls(**{name: arrays[f"block_{name}"] for name in cls.__dataclass_fields__})
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Arrays from which from_arrays rebuilds these blocks."""
+        return {f"block_{name}": getattr(self, name) for name in self.__dataclass_fields__}
+
+
+@dataclass(frozen=True)
+class CareerIndex:
+    """Read-only compiled view of the careers catalog."""
+    store: CareerStore
+    skill_names: List[str]
+    skill_lookup: Dict[str, int]
+    skill_offsets: array
+    skill_ids: array
+    skill_blocks: SkillBlocks
+    skill_matcher: SkillMatcher
+    skill_corrector: Optional[SkillCorrector]
+    categories: List[str]
+    career_categories: array
+    category_postings: List[array]
+    experience_levels: List[str]
+    career_experience: array
+    experience_postings: List[array]
+    experience_lower: List[str]
+    experience_ranks: List[int]
+    group_postings: List[array]
+
+    @classmethod
+    def build(cls, careers: List[Dict[str, Any]], normalize_skill: Callable[[str], str],
+              known_skills: Optional[Dict[str, str]] = None) -> "CareerIndex":
+        """
+        Compile careers into skill IDs and posting lists.
+
+        Args:
+            careers: Raw career dictionaries as loaded from careers.json
+            normalize_skill: Function mapping a raw skill name to its canonical form
+            known_skills: Names besides the catalog skills (e.g. synonyms) that
+                misspelled user skills may be corrected to, mapped to the skill
+                they stand for; None disables typo correction
+
+        Returns:
+            CareerIndex over the given careers
+        """
+        store = CareerStore(careers)
+
+        # Normalize each distinct skill string once
+        skill_names: List[str] = []
+        skill_lookup: Dict[str, int] = {}
+        raw_to_skill_id = []
+        for raw_skill in store.skills.values:
+            normalized = normalize_skill(raw_skill)
+            skill_id = skill_lookup.get(normalized)
+            if skill_id is None:
+                skill_id = len(skill_names)
+                skill_lookup[normalized] = skill_id
+                skill_names.append(normalized)
+            raw_to_skill_id.append(skill_id)
+
+        skill_offsets = store.skill_offsets
+        skill_ids = array("i", (raw_to_skill_id[code] for code in store.skills.codes))
+
+        # Careers per (category, experience level) pair, which score alike
+        # when no skill matches
+        num_levels = len(store.experience_levels.values)
+        group_postings = [array("i") for _ in range(len(store.categories.values) * num_levels)]
+        for position, (category_id, experience_id) in enumerate(
+            zip(store.categories.codes, store.experience_levels.codes)
+        ):
+            group_postings[category_id * num_levels + experience_id].append(position)
+        career_groups = (
+            np.frombuffer(store.categories.codes, dtype=np.int32).astype(np.int64) * num_levels +
+            np.frombuffer(store.experience_levels.codes, dtype=np.int32)
+        )
+
+        # Experience levels parsed once into seniority ranks
+        experience_lower, experience_ranks = cls._parse_experience_levels(store.experience_levels.values)
+
+        return cls(
+            store=store,
+            skill_names=skill_names,
+            skill_lookup=skill_lookup,
+            skill_offsets=skill_offsets,
+            skill_ids=skill_ids,
+            skill_blocks=SkillBlocks.build(skill_offsets, skill_ids, career_groups, len(skill_names)),
+            skill_matcher=SkillMatcher(skill_names),
+            skill_corrector=SkillCorrector(skill_names + list(known_skills), known_skills) if known_skills is not None else None,
+            categories=store.categories.values,
+            career_categories=store.categories.codes,
+            category_postings=cls._postings(store.categories),
+            experience_levels=store.experience_levels.values,
+            career_experience=store.experience_levels.codes,
+            experience_postings=cls._postings(store.experience_levels),
+            experience_lower=experience_lower,
+            experience_ranks=experience_ranks,
+            group_postings=group_postings,
+        )
+
+    @classmethod
+    def from_arrays(cls, store: CareerStore, arrays: Dict[str, np.ndarray], meta: Dict[str, Any],
+                    known_skills: Optional[Dict[str, str]] = None) -> "CareerIndex":
+        """
+        Index restored from to_arrays output, without visiting any career.
+
+        Args:
+            store: Store restored from the same catalog snapshot
+            arrays: Arrays produced by to_arrays
+            meta: Metadata produced by to_arrays
+            known_skills: As in build
+
+        Returns:
+            CareerIndex over `store`
+        """
+        skill_names = meta["skill_names"]
+        experience_lower, experience_ranks = cls._parse_experience_levels(store.experience_levels.values)
+        return cls(
+            store=store,
+            skill_names=skill_names,
+            skill_lookup={name: skill_id for skill_id, name in enumerate(skill_names)},
+            skill_offsets=store.skill_offsets,
+            skill_ids=to_array("i", arrays["skill_ids"]),
+            skill_blocks=SkillBlocks.from_arrays(arrays),
+            skill_matcher=SkillMatcher(skill_names),
+            skill_corrector=SkillCorrector(skill_names + list(known_skills), known_skills) if known_skills is not None else None,
+            categories=store.categories.values,
+            career_categories=store.categories.codes,
+            category_postings=cls._split_postings(arrays, "category"),
+            experience_levels=store.experience_levels.values,
+            career_experience=store.experience_levels.codes,
+            experience_postings=cls._split_postings(arrays, "experience"),
+            experience_lower=experience_lower,
+            experience_ranks=experience_ranks,
+            group_postings=cls._split_postings(arrays, "group"),
+        )
+
+    def to_arrays(self) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+        """
+        Arrays and JSON-serializable metadata from which from_arrays rebuilds
+        this index (the store is saved separately).
+
+        Returns:
+            Tuple of (arrays, metadata)
+        """
+        arrays = {
+            "skill_ids": np.frombuffer(self.skill_ids, dtype=np.int32),
+        }
+        arrays.update(self.skill_blocks.to_arrays())
+        for name in ("category", "experience", "group"):
+            postings = getattr(self, f"{name}_postings")
+            indptr = np.zeros(len(postings) + 1, dtype=np.int64)
+            np.cumsum([len(positions) for positions in postings], out=indptr[1:])
+            arrays[f"{name}_indptr"] = indptr
+            arrays[f"{name}_positions"] = np.frombuffer(
+                b"".join(positions.tobytes() for positions in postings), dtype=np.int32
+            )
+        return arrays, {"skill_names": self.skill_names}
+
+    @staticmethod
+    def _split_postings(arrays: Dict[str, np.ndarray], name: str) -> List[array]:
+        """Posting lists stored by to_arrays as one flat array plus offsets."""
+        positions = to_array("i", arrays[f"{name}_positions"])
+        bounds = arrays[f"{name}_indptr"].tolist()
+        return [positions[start:stop] for start, stop in zip(bounds, bounds[1:])]
+
+    @staticmethod
+    def _parse_experience_levels(levels: List[Any]) -> Tuple[List[str], List[int]]:
+        """Lowercase experience levels and their seniority ranks."""
+        experience_lower = [level.lower() if isinstance(level, str) else "" for level in levels]
+        return experience_lower, [parse_experience_level(level) for level in experience_lower]
+
+    @staticmethod
+    def _postings(column) -> List[array]:
+        """Career positions per code of a dictionary-encoded column."""
+        postings = [array("i") for _ in column.values]
+        for position, code in enumerate(column.codes):
+            postings[code].append(position)
+        return postings
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def positions_where(self, category: Optional[str] = None,
+                        experience_level: Optional[str] = None) -> Sequence[int]:
+        """
+        Ascending positions of careers with the given category and/or experience level.
+
+        Answered from the posting lists; no career is visited.
+        """
+        store = self.store
+        category_id = experience_id = None
+        if category is not None:
+            category_id = store.categories.code(category)
+            if category_id is None:
+                return array("i")
+        if experience_level is not None:
+            experience_id = store.experience_levels.code(experience_level)
+            if experience_id is None:
+                return array("i")
+
+        if category_id is not None and experience_id is not None:
+            return self.group_postings[category_id * len(self.experience_levels) + experience_id]
+        if category_id is not None:
+            return self.category_postings[category_id]
+        if experience_id is not None:
+            return self.experience_postings[experience_id]
+        return range(len(self))
+
+    def career_skills(self, position: int) -> array:
+        """Normalized skill IDs required by the career at `position`, in file order."""
+        return self.skill_ids[self.skill_offsets[position]:self.skill_offsets[position + 1]]
+
+
+@dataclass
+class ScoringInputs:
+    """Per-request values resolved against a CareerIndex, shared by all scoring backends."""
+    exact_ids: Set[int]
+    related_counts: Dict[int, int]
+    interest_scores: List[float]
+    category_bonuses: List[float]
+    experience_bonuses: List[float]
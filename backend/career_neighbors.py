@@ -0,0 +1,279 @@
+"""
+Career Neighbors Module
+Precomputed "similar careers" lists: each career's nearest careers by
+skill-set Jaccard similarity plus a same-category bonus.
+"""
+
+from typing import List, Dict, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from career_index import CareerIndex
+
+# Similarity weights of the skill-set Jaccard index and of sharing a category
+SKILL_WEIGHT = 0.8
+CATEGORY_WEIGHT = 0.2
+
+DEFAULT_NEIGHBORS = 20
+
+# Skills held by more careers than this are common: rather than pairing all
+# of their careers, they pair careers within groups of this many
+MAX_SKILL_CAREERS = 128
+
+# Estimated candidate pairs materialized at once
+BLOCK_PAIRS = 1 << 22
+
+# Score histogram resolution used to discard candidates before sorting
+SCORE_BUCKETS = 256
+
+
+def _swar_popcount(words: np.ndarray) -> np.ndarray:
+    """Set bits of each uint64, for numpy versions without bitwise_count."""
+    words = words - ((words >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    words = (words & np.uint64(0x3333333333333333)) + ((words >> np.uint64(2)) & np.uint64(0x3333333333333333))
+    words = (words + (words >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return ((words * np.uint64(0x0101010101010101)) >> np.uint64(56)).astype(np.int64)
+
+
+_popcount = getattr(np, "bitwise_count", _swar_popcount)
+
+
+class CareerNeighbors:
+    """
+    The most similar careers of every career, in two fixed-width arrays.
+
+    Similarity is SKILL_WEIGHT * |A & B| / |A | B| over the careers' distinct
+    normalized skills, plus CATEGORY_WEIGHT if both have the same non-empty
+    category. Careers sharing a skill are candidates, and so are careers of
+    the same category when a row has too few candidates scoring above
+    CATEGORY_WEIGHT; all scores are exact. Candidates sharing a skill held by
+    at most `max_skill_careers` careers come from the sparse product of the career x skill incidence
+    matrix with its transpose. A common skill would make that product close
+    to dense, so its careers are ordered by the set of common skills they
+    hold and only paired within consecutive groups of `max_skill_careers`;
+    neighbors reached only through common skills are therefore approximate.
+    This bounds the pairs to about max_skill_careers per skill occurrence.
+    Overlaps in common skills are counted on per-career bitmasks.
+
+    Rows are processed in blocks of about `block_pairs` estimated pairs. A
+    per-career histogram of candidate scores finds the bucket holding the
+    N-th best score, so only candidates at or above it are sorted. Ties are
+    broken by catalog position. Careers with a similarity of 0 (no shared
+    skill, different category) are never neighbors, and rows with fewer
+    candidates than `num_neighbors` are padded with -1.
+    """
+
+    def __init__(self, index: CareerIndex, num_neighbors: int = DEFAULT_NEIGHBORS,
+                 max_skill_careers: int = MAX_SKILL_CAREERS, block_pairs: int = BLOCK_PAIRS):
+        """
+        Args:
+            index: Compiled catalog
+            num_neighbors: Neighbors kept per career
+            max_skill_careers: Careers per skill above which the skill is common
+            block_pairs: Estimated candidate pairs scored per sparse product
+        """
+        num_careers = len(index)
+        self.num_neighbors = num_neighbors
+        self.neighbors = np.full((num_careers, num_neighbors), -1, dtype=np.int32)
+        self.scores = np.zeros((num_careers, num_neighbors))
+
+        # Copies, since sum_duplicates() sorts in place and asarray() would
+        # share the index's buffers
+        incidence = sparse.csr_matrix(
+            (
+                np.ones(len(index.skill_ids), dtype=np.int64),
+                np.array(index.skill_ids, dtype=np.int32),
+                np.array(index.skill_offsets, dtype=np.int64)
+            ),
+            shape=(num_careers, len(index.skill_names))
+        )
+        incidence.sum_duplicates()
+        incidence.data[:] = 1
+        sizes = np.diff(incidence.indptr)
+        transposed = incidence.T.tocsr()
+        frequencies = np.diff(transposed.indptr)
+
+        common = frequencies > max_skill_careers
+        rare_incidence = incidence[:, np.flatnonzero(~common)].tocsr()
+        rare_transposed = rare_incidence.T.tocsr()
+        masks = self._common_masks(incidence, common)
+        group_incidence = self._common_groups(transposed, common, masks, max_skill_careers)
+        group_transposed = group_incidence.T.tocsr()
+        # Rare overlaps are packed above the group products' counts, which
+        # never exceed the number of common skills
+        packing = int(np.count_nonzero(common)) + 1
+
+        # Careers without a category get codes that never compare equal
+        categories = np.asarray(index.career_categories, dtype=np.int64)
+        has_category = np.array([bool(category) for category in index.categories], dtype=bool)[categories]
+        row_categories = np.where(has_category, categories, -1)
+        col_categories = np.where(has_category, categories, -2)
+        # Careers of each category in catalog order
+        category_careers = np.argsort(categories, kind="stable")
+        category_starts = np.zeros(len(index.categories) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(categories, minlength=len(index.categories)), out=category_starts[1:])
+
+        work = (
+            rare_incidence @ frequencies[~common]
+            + group_incidence @ np.diff(group_transposed.indptr)
+        )
+        ends = np.cumsum(work)
+        start = 0
+        while start < num_careers:
+            done = ends[start - 1] if start else 0
+            stop = max(int(np.searchsorted(ends, done + block_pairs, side="right")), start + 1)
+            candidates = (
+                (rare_incidence[start:stop] @ rare_transposed) * packing
+                + group_incidence[start:stop] @ group_transposed
+            ).tocsr()
+            counts = np.diff(candidates.indptr)
+            cols = candidates.indices
+            rows = np.repeat(np.arange(start, stop), counts)
+            shared = candidates.data // packing + self._common_overlap(masks, rows, cols)
+            scores = self._similarity(rows, cols, shared, sizes, row_categories, col_categories)
+
+            extra_rows, extra_cols = self._category_fillers(
+                rows, cols, scores, start, stop, row_categories, category_careers, category_starts
+            )
+            if extra_rows.size:
+                # Fillers share no rare skill, or they would be candidates
+                extra_shared = self._common_overlap(masks, extra_rows, extra_cols)
+                rows = np.concatenate([rows, extra_rows])
+                cols = np.concatenate([cols, extra_cols])
+                scores = np.concatenate([
+                    scores,
+                    self._similarity(extra_rows, extra_cols, extra_shared, sizes, row_categories, col_categories)
+                ])
+            self._fill_block(rows, cols, scores, start, stop)
+            start = stop
+
+    @staticmethod
+    def _common_overlap(masks: np.ndarray, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """Common skills shared by each (rows[i], cols[i]) pair of careers."""
+        shared = np.zeros(rows.size, dtype=np.int64)
+        for word in masks:
+            shared += _popcount(word[rows] & word[cols])
+        return shared
+
+    @staticmethod
+    def _similarity(rows: np.ndarray, cols: np.ndarray, shared: np.ndarray, sizes: np.ndarray,
+                    row_categories: np.ndarray, col_categories: np.ndarray) -> np.ndarray:
+        """Similarity of each (rows[i], cols[i]) pair sharing shared[i] skills."""
+        union = sizes[rows] + sizes[cols] - shared
+        jaccard = np.divide(shared, union, out=np.zeros(rows.size), where=union > 0)
+        return SKILL_WEIGHT * jaccard + CATEGORY_WEIGHT * (row_categories[rows] == col_categories[cols])
+
+    def _category_fillers(self, rows: np.ndarray, cols: np.ndarray, scores: np.ndarray, start: int, stop: int,
+                          row_categories: np.ndarray, category_careers: np.ndarray,
+                          category_starts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Same-category careers that are not candidates, for rows the candidates cannot fill.
+
+        A same-category career sharing no skill scores exactly CATEGORY_WEIGHT,
+        more than a weak cross-category match. Every same-category candidate
+        scores above CATEGORY_WEIGHT, so a row with m candidates above it
+        needs at most the first num_neighbors + m + 1 careers of its category,
+        whose catalog order is also their tie order.
+        """
+        num_careers = len(row_categories)
+        local_rows = rows - start
+        above = np.bincount(local_rows[(scores > CATEGORY_WEIGHT) & (cols != rows)], minlength=stop - start)
+        block_categories = row_categories[start:stop]
+        needy = (above < self.num_neighbors) & (block_categories >= 0)
+        needy_rows = np.flatnonzero(needy)
+        if not needy_rows.size:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+        needy_categories = block_categories[needy_rows]
+        first = category_starts[needy_categories]
+        take = np.minimum(self.num_neighbors + above[needy_rows] + 1, category_starts[needy_categories + 1] - first)
+        filler_rows = np.repeat(needy_rows + start, take)
+        offsets = np.arange(filler_rows.size) - np.repeat(np.cumsum(take) - take, take)
+        filler_cols = category_careers[np.repeat(first, take) + offsets]
+
+        # Drop each career itself and its existing candidates
+        known = needy[local_rows]
+        candidate_keys = rows[known] * num_careers + cols[known]
+        kept = (filler_cols != filler_rows) & ~np.isin(filler_rows * num_careers + filler_cols, candidate_keys)
+        return filler_rows[kept], filler_cols[kept]
+
+    @staticmethod
+    def _common_masks(incidence: sparse.csr_matrix, common: np.ndarray) -> np.ndarray:
+        """Bitmasks of the common skills each career holds, as (words, careers) uint64s."""
+        bits = np.cumsum(common) - 1
+        masks = np.zeros((-(-int(np.count_nonzero(common)) // 64), incidence.shape[0]), dtype=np.uint64)
+        rows = np.repeat(np.arange(incidence.shape[0]), np.diff(incidence.indptr))
+        held = common[incidence.indices]
+        rows, bits = rows[held], bits[incidence.indices[held]]
+        np.bitwise_or.at(masks, (bits // 64, rows), np.left_shift(np.uint64(1), (bits % 64).astype(np.uint64)))
+        return masks
+
+    @staticmethod
+    def _common_groups(transposed: sparse.csr_matrix, common: np.ndarray, masks: np.ndarray,
+                       group_size: int) -> sparse.csr_matrix:
+        """Career x group incidence splitting each common skill's careers into groups of `group_size`."""
+        num_careers = transposed.shape[1]
+        group_rows = []
+        group_cols = []
+        num_groups = 0
+        for skill_id in np.flatnonzero(common):
+            careers = transposed.indices[transposed.indptr[skill_id]:transposed.indptr[skill_id + 1]]
+            # Careers with similar common skill sets end up in the same group
+            careers = careers[np.lexsort(masks[::-1, careers])]
+            group_rows.append(careers)
+            group_cols.append(num_groups + np.arange(careers.size) // group_size)
+            num_groups += -(-careers.size // group_size)
+        if not group_rows:
+            return sparse.csr_matrix((num_careers, 0), dtype=np.int64)
+        rows = np.concatenate(group_rows)
+        return sparse.csr_matrix(
+            (np.ones(rows.size, dtype=np.int64), (rows, np.concatenate(group_cols))),
+            shape=(num_careers, num_groups)
+        )
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "CareerNeighbors":
+        """Neighbor lists restored from to_arrays output, without copying."""
+        neighbors = cls.__new__(cls)
+        neighbors.neighbors = arrays["neighbors"]
+        neighbors.scores = arrays["scores"]
+        neighbors.num_neighbors = neighbors.neighbors.shape[1]
+        return neighbors
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Arrays from which from_arrays rebuilds these neighbor lists."""
+        return {"neighbors": self.neighbors, "scores": self.scores}
+
+    def _fill_block(self, rows: np.ndarray, cols: np.ndarray, scores: np.ndarray, start: int, stop: int) -> None:
+        """Keep the best `num_neighbors` candidates of each career in rows start..stop."""
+        block_size = stop - start
+
+        # Lowest score bucket each career needs to fill its neighbor list
+        # (plus itself, which is among its candidates and dropped after sorting)
+        local_rows = rows - start
+        buckets = np.minimum((scores * SCORE_BUCKETS).astype(np.int64), SCORE_BUCKETS - 1)
+        histogram = np.bincount(local_rows * SCORE_BUCKETS + buckets, minlength=block_size * SCORE_BUCKETS)
+        at_least = np.cumsum(histogram.reshape(block_size, SCORE_BUCKETS)[:, ::-1], axis=1) > self.num_neighbors
+        lowest = np.where(at_least[:, -1], SCORE_BUCKETS - 1 - np.argmax(at_least, axis=1), 0)
+        kept = buckets >= lowest[local_rows]
+        rows, cols, scores = rows[kept], cols[kept], scores[kept]
+        other = cols != rows
+        rows, cols, scores = rows[other], cols[other], scores[other]
+
+        order = np.lexsort((cols, -scores, rows))
+        rows, cols, scores = rows[order], cols[order], scores[order]
+        row_starts = np.searchsorted(rows, rows, side="left")
+        ranks = np.arange(rows.size) - row_starts
+        kept = ranks < self.num_neighbors
+        self.neighbors[rows[kept], ranks[kept]] = cols[kept]
+        self.scores[rows[kept], ranks[kept]] = scores[kept]
+
+    def similar(self, position: int, limit: int) -> List[Tuple[int, float]]:
+        """Positions and similarities (rounded to 3 decimals) of a career's `limit` nearest careers."""
+        neighbors = self.neighbors[position, :limit]
+        count = int(np.count_nonzero(neighbors >= 0))
+        return [
+            (int(neighbor), round(float(score), 3))
+            for neighbor, score in zip(neighbors[:count], self.scores[position, :count])
+        ]
@@ -0,0 +1,276 @@
+"""
+Career Store Module
+Columnar, dictionary-encoded storage for the careers catalog.
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import List, Dict, Any, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# Fields of a career entry in careers.json, in file order
+CAREER_FIELDS = (
+    "id", "title", "category", "description", "required_skills",
+    "experience_level", "salary_range", "education"
+)
+
+_STRING_FIELDS = ("title", "category", "description", "experience_level", "salary_range", "education")
+
+# CareerStore attribute holding each scalar field
+_FIELD_COLUMNS = {
+    "id": "ids", "title": "titles", "category": "categories", "description": "descriptions",
+    "experience_level": "experience_levels", "salary_range": "salary_ranges", "education": "educations"
+}
+
+
+class _Dictionary:
+    """Dictionary encoding of a repeated value column."""
+
+    __slots__ = ("values", "codes", "_lookup")
+
+    def __init__(self):
+        self.values: List[Any] = []
+        self.codes = array("i")
+        self._lookup: Dict[Any, int] = {}
+
+    def add(self, value: Any) -> int:
+        code = self.encode(value)
+        self.codes.append(code)
+        return code
+
+    def encode(self, value: Any) -> int:
+        code = self._lookup.get(value)
+        if code is None:
+            code = len(self.values)
+            self._lookup[value] = code
+            self.values.append(value)
+        return code
+
+    def __getitem__(self, position: int) -> Any:
+        return self.values[self.codes[position]]
+
+    def code(self, value: Any) -> Optional[int]:
+        """Code of `value`, or None if no row has it."""
+        return self._lookup.get(value)
+
+    @classmethod
+    def from_codes(cls, values: List[Any], codes: np.ndarray) -> "_Dictionary":
+        """Dictionary with the given distinct values and per-row codes."""
+        column = cls()
+        column.values = values
+        column.codes = to_array("i", codes)
+        column._lookup = {value: code for code, value in enumerate(values)}
+        return column
+
+
+class _StringColumn:
+    """
+    Strings held as one UTF-8 buffer plus offsets, decoded when accessed.
+
+    Used for titles and descriptions loaded from a catalog snapshot, so
+    startup does not create a string object per career. Values that are not
+    strings are kept aside in `overrides`.
+    """
+
+    __slots__ = ("data", "offsets", "overrides")
+
+    def __init__(self, data: np.ndarray, offsets: np.ndarray, overrides: Dict[int, Any]):
+        self.data = data
+        self.offsets = offsets
+        self.overrides = overrides
+
+    @staticmethod
+    def encode(values: Sequence[Any]) -> Tuple[np.ndarray, np.ndarray, Dict[int, Any]]:
+        """UTF-8 buffer, offsets and non-string values of a column."""
+        overrides = {}
+        chunks = []
+        for position in range(len(values)):
+            value = values[position]
+            if isinstance(value, str):
+                chunks.append(value.encode("utf-8", "surrogatepass"))
+            else:
+                overrides[position] = value
+                chunks.append(b"")
+        offsets = np.zeros(len(chunks) + 1, dtype=np.int64)
+        np.cumsum([len(chunk) for chunk in chunks], out=offsets[1:])
+        return np.frombuffer(b"".join(chunks), dtype=np.uint8), offsets, overrides
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, position: int) -> Any:
+        if self.overrides and position in self.overrides:
+            return self.overrides[position]
+        return self.data[self.offsets[position]:self.offsets[position + 1]].tobytes().decode("utf-8", "surrogatepass")
+
+
+def to_array(typecode: str, values: np.ndarray) -> array:
+    """Copy a NumPy array into an array.array of the same item size."""
+    result = array(typecode)
+    result.frombytes(np.ascontiguousarray(values).tobytes())
+    return result
+
+
+def _is_regular(career: Dict[str, Any]) -> bool:
+    """Whether a career matches the careers.json schema exactly."""
+    if len(career) != len(CAREER_FIELDS) or any(field not in career for field in CAREER_FIELDS):
+        return False
+    if type(career["id"]) is not int or not isinstance(career["required_skills"], list):
+        return False
+    return all(isinstance(career[field], str) for field in _STRING_FIELDS) and all(
+        isinstance(skill, str) for skill in career["required_skills"]
+    )
+
+
+class CareerStore:
+    """
+    Careers held column by column instead of as a list of dicts.
+
+    Repeated values (category, experience level, salary range, education and
+    skill names) are stored once and referenced through integer code arrays,
+    and required skills are one flat code array with per-career offsets.
+    Entries that do not follow the careers.json schema are also kept verbatim
+    so they round-trip unchanged.
+    """
+
+    # Dictionary-encoded columns
+    _DICTIONARIES = ("categories", "experience_levels", "salary_ranges", "educations", "skills")
+
+    def __init__(self, careers: List[Dict[str, Any]]):
+        ids: List[Any] = []
+        numeric: List[int] = []
+        self.titles: Union[List[Any], _StringColumn] = []
+        self.descriptions: Union[List[Any], _StringColumn] = []
+        self.categories = _Dictionary()
+        self.experience_levels = _Dictionary()
+        self.salary_ranges = _Dictionary()
+        self.educations = _Dictionary()
+        self.skills = _Dictionary()
+        self.skill_offsets = array("q", [0])
+        self.irregular: Dict[int, Dict[str, Any]] = {}
+
+        for position, career in enumerate(careers):
+            ids.append(career.get("id", 0))
+            if isinstance(career.get("id"), (int, float)):
+                numeric.append(position)
+            self.titles.append(career.get("title", ""))
+            self.descriptions.append(career.get("description", ""))
+            self.categories.add(career.get("category", ""))
+            self.experience_levels.add(career.get("experience_level", ""))
+            self.salary_ranges.add(career.get("salary_range", ""))
+            self.educations.add(career.get("education", ""))
+            for skill in career.get("required_skills", []):
+                self.skills.add(skill)
+            self.skill_offsets.append(len(self.skills.codes))
+
+            if not _is_regular(career):
+                self.irregular[position] = career
+
+        self.ids: Union[array, List[Any]] = (
+            array("q", ids) if all(type(career_id) is int for career_id in ids) else ids
+        )
+
+        # Positions ordered by numeric id (catalog order among duplicates)
+        numeric.sort(key=lambda position: ids[position])
+        self._id_order = array("q", numeric)
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def to_arrays(self) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+        """
+        Arrays and JSON-serializable metadata from which from_arrays rebuilds this store.
+
+        Returns:
+            Tuple of (arrays, metadata)
+        """
+        arrays = {
+            "skill_offsets": np.frombuffer(self.skill_offsets, dtype=np.int64),
+            "id_order": np.frombuffer(self._id_order, dtype=np.int64),
+        }
+        meta: Dict[str, Any] = {"dictionaries": {}, "overrides": {}}
+        for name in self._DICTIONARIES:
+            column = getattr(self, name)
+            arrays[f"{name}_codes"] = np.frombuffer(column.codes, dtype=np.int32)
+            meta["dictionaries"][name] = column.values
+        for name in ("titles", "descriptions"):
+            data, offsets, overrides = _StringColumn.encode(getattr(self, name))
+            arrays[f"{name}_data"] = data
+            arrays[f"{name}_offsets"] = offsets
+            meta["overrides"][name] = list(overrides.items())
+        if isinstance(self.ids, array):
+            arrays["ids"] = np.frombuffer(self.ids, dtype=np.int64)
+        else:
+            meta["ids"] = self.ids
+        meta["irregular"] = list(self.irregular.items())
+        return arrays, meta
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray], meta: Dict[str, Any]) -> "CareerStore":
+        """
+        Store restored from to_arrays output.
+
+        Code and offset columns are copied out of `arrays`; titles and
+        descriptions keep viewing them and are decoded on access.
+        """
+        store = cls.__new__(cls)
+        for name in ("titles", "descriptions"):
+            overrides = {position: value for position, value in meta["overrides"][name]}
+            setattr(store, name, _StringColumn(arrays[f"{name}_data"], arrays[f"{name}_offsets"], overrides))
+        for name in cls._DICTIONARIES:
+            setattr(store, name, _Dictionary.from_codes(meta["dictionaries"][name], arrays[f"{name}_codes"]))
+        store.skill_offsets = to_array("q", arrays["skill_offsets"])
+        store.irregular = {position: career for position, career in meta["irregular"]}
+        store.ids = to_array("q", arrays["ids"]) if "ids" in arrays else meta["ids"]
+        store._id_order = to_array("q", arrays["id_order"])
+        return store
+
+    def required_skills(self, position: int) -> List[Any]:
+        """Required skills of the career at `position`, as written in careers.json."""
+        values = self.skills.values
+        codes = self.skills.codes
+        return [values[codes[i]] for i in range(self.skill_offsets[position], self.skill_offsets[position + 1])]
+
+    def find(self, career_id: Any) -> Optional[int]:
+        """Position of the first career with `career_id`, or None."""
+        order = self._id_order
+        ids = self.ids
+        at = bisect_left(order, career_id, key=ids.__getitem__)
+        if at < len(order) and ids[order[at]] == career_id:
+            return order[at]
+        return None
+
+    def get(self, position: int, fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """
+        The career at `position` as a careers.json dictionary.
+
+        Args:
+            position: Catalog position
+            fields: Only include these fields (those an irregular entry lacks are skipped)
+        """
+        irregular = self.irregular.get(position)
+        if irregular is not None:
+            if fields is None:
+                return irregular
+            return {field: irregular[field] for field in fields if field in irregular}
+        if fields is not None:
+            return {
+                field: self.required_skills(position) if field == "required_skills"
+                else getattr(self, _FIELD_COLUMNS[field])[position]
+                for field in fields
+            }
+        return {
+            "id": self.ids[position],
+            "title": self.titles[position],
+            "category": self.categories[position],
+            "description": self.descriptions[position],
+            "required_skills": self.required_skills(position),
+            "experience_level": self.experience_levels[position],
+            "salary_range": self.salary_ranges[position],
+            "education": self.educations[position],
+        }
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Every career as a careers.json dictionary, in catalog order."""
+        return [self.get(position) for position in range(len(self))]
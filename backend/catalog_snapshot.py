@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Catalog Snapshot Module
+Binary, memory-mappable catalog files compiled from careers.json, so workers
+start without parsing JSON or rebuilding per-career indexes.
+
+Layout: an 8-byte magic, the little-endian uint64 length of a UTF-8 JSON
+header, the header, then every array's raw bytes at a 64-byte aligned
+offset. The header holds the format version, small metadata (vocabularies,
+dictionary values, facet counts) and each array's dtype, shape and offset.
+"""
+
+import argparse
+import json
+import os
+import struct
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+MAGIC = b"UPSKCAT\x00"
+FORMAT_VERSION = 4
+
+_ALIGNMENT = 64
+
+
+def is_catalog_snapshot(path: str) -> bool:
+    """Whether `path` starts with the catalog snapshot magic."""
+    try:
+        with open(path, "rb") as file:
+            return file.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def write_catalog_snapshot(path: str, arrays: Dict[str, np.ndarray], meta: Dict[str, Any]) -> None:
+    """
+    Write arrays and JSON metadata to `path` atomically.
+
+    Args:
+        path: Destination file
+        arrays: Named arrays (stored C-contiguous, native little-endian)
+        meta: JSON-serializable metadata
+    """
+    layout = {}
+    payloads = []
+    offset = 0
+    for name, values in arrays.items():
+        values = np.ascontiguousarray(values)
+        offset = _aligned(offset)
+        layout[name] = {"dtype": values.dtype.str, "shape": list(values.shape), "offset": offset}
+        payloads.append((offset, values))
+        offset += values.nbytes
+
+    header = json.dumps(
+        {"format_version": FORMAT_VERSION, "arrays": layout, "meta": meta}, ensure_ascii=False
+    ).encode("utf-8")
+    data_start = _aligned(len(MAGIC) + 8 + len(header))
+
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "wb") as file:
+        file.write(MAGIC)
+        file.write(struct.pack("<Q", len(header)))
+        file.write(header)
+        for array_offset, values in payloads:
+            file.seek(data_start + array_offset)
+            file.write(values.tobytes())
+    os.replace(temporary_path, path)
+
+
+def read_catalog_snapshot(path: str) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """
+    Map a catalog snapshot into memory.
+
+    Returns:
+        (read-only arrays viewing the mapped file, metadata)
+
+    Raises:
+        ValueError: If the file is not a catalog snapshot of this format version
+    """
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Not a catalog snapshot: {path}")
+        (header_length,) = struct.unpack("<Q", file.read(8))
+        header = json.loads(file.read(header_length).decode("utf-8"))
+    if header.get("format_version") != FORMAT_VERSION:
+        raise ValueError(
+            f"Catalog snapshot {path} has format version {header.get('format_version')}, "
+            f"expected {FORMAT_VERSION}; rebuild it"
+        )
+
+    data_start = _aligned(len(MAGIC) + 8 + header_length)
+    mapped = np.memmap(path, dtype=np.uint8, mode="r")
+    arrays = {}
+    for name, spec in header["arrays"].items():
+        dtype = np.dtype(spec["dtype"])
+        count = int(np.prod(spec["shape"], dtype=np.int64))
+        start = data_start + spec["offset"]
+        arrays[name] = mapped[start:start + count * dtype.itemsize].view(dtype).reshape(spec["shape"])
+    return arrays, header["meta"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compile careers.json into a binary catalog snapshot")
+    parser.add_argument("careers_file", help="Path to careers.json")
+    parser.add_argument("output", help="Path of the snapshot to write, e.g. careers.snapshot")
+    parser.add_argument("--similar-careers", action="store_true",
+                        help="Precompute the similar-career lists into the snapshot")
+    args = parser.parse_args()
+
+    from recommendation_engine import RecommendationEngine
+
+    engine = RecommendationEngine(args.careers_file, cache_size=0, similar_careers=args.similar_careers)
+    engine.save_catalog_snapshot(args.output)
+    print(f"Wrote {engine.count_careers()} careers to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Catalog Watcher Module
+Polls careers.json for changes and triggers a reload off the request path.
+"""
+
+import os
+import threading
+from typing import Callable, Optional
+
+
+class CatalogWatcher:
+    """Background thread that calls `on_change` when a file's mtime changes."""
+
+    def __init__(self, get_path: Callable[[], Optional[str]], on_change: Callable[[], object],
+                 interval: float = 5.0):
+        """
+        Args:
+            get_path: Returns the file to watch (re-evaluated on every poll)
+            on_change: Called from the watcher thread when the file changes
+            interval: Seconds between polls
+        """
+        self.get_path = get_path
+        self.on_change = on_change
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_mtime = self._current_mtime()
+
+    def _current_mtime(self) -> Optional[float]:
+        path = self.get_path()
+        if not path:
+            return None
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return None
+
+    def poll(self) -> bool:
+        """Check the file once, calling `on_change` if it was modified."""
+        mtime = self._current_mtime()
+        if mtime is None or mtime == self._last_mtime:
+            return False
+        self._last_mtime = mtime
+        try:
+            self.on_change()
+        except Exception as e:
+            print(f"Error reloading careers data: {e}")
+        return True
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.poll()
+
+    def start(self) -> None:
+        """Start polling in a daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="catalog-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop polling and wait for the thread to exit."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
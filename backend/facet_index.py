@@ -0,0 +1,131 @@
+"""
+Facet Index Module
+Distinct values and career counts for the catalog's filter facets, built
+once per catalog load.
+"""
+
+from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+
+from career_store import CareerStore
+
+
+def _sorted_counts(counts: Dict[str, int]) -> Dict[str, int]:
+    return {value: counts[value] for value in sorted(counts)}
+
+
+@dataclass(frozen=True)
+class FacetIndex:
+    """
+    Careers per category, per skill and per experience level.
+
+    Skill and experience level counts are also kept per category so the
+    filter sidebar can show counts within a selected category. Empty
+    categories and experience levels are not facets; a skill is counted once
+    per career even if listed twice.
+    """
+    total_careers: int
+    category_counts: Dict[str, int]
+    skill_counts: Dict[str, int]
+    experience_counts: Dict[str, int]
+    category_skill_counts: Dict[str, Dict[str, int]]
+    category_experience_counts: Dict[str, Dict[str, int]]
+
+    @classmethod
+    def build(cls, store: CareerStore) -> "FacetIndex":
+        """Count facet values over every career in `store`."""
+        categories = store.categories
+        experience_levels = store.experience_levels
+        skill_values = store.skills.values
+        skill_codes = store.skills.codes
+
+        category_totals = [0] * len(categories.values)
+        experience_totals = [[0] * len(experience_levels.values) for _ in categories.values]
+        skill_totals = [dict() for _ in categories.values]
+        for position in range(len(store)):
+            category_id = categories.codes[position]
+            category_totals[category_id] += 1
+            experience_totals[category_id][experience_levels.codes[position]] += 1
+            category_skills = skill_totals[category_id]
+            for skill_id in set(skill_codes[store.skill_offsets[position]:store.skill_offsets[position + 1]]):
+                category_skills[skill_id] = category_skills.get(skill_id, 0) + 1
+
+        category_counts = {}
+        skill_counts: Dict[str, int] = {}
+        experience_counts: Dict[str, int] = {}
+        category_skill_counts = {}
+        category_experience_counts = {}
+        for category_id, category in enumerate(categories.values):
+            in_category = {skill_values[skill_id]: count for skill_id, count in skill_totals[category_id].items()}
+            for skill, count in in_category.items():
+                skill_counts[skill] = skill_counts.get(skill, 0) + count
+            levels = {
+                level: count
+                for level, count in zip(experience_levels.values, experience_totals[category_id])
+                if level and count
+            }
+            for level, count in levels.items():
+                experience_counts[level] = experience_counts.get(level, 0) + count
+
+            if category:
+                category_counts[category] = category_totals[category_id]
+                category_skill_counts[category] = _sorted_counts(in_category)
+                category_experience_counts[category] = _sorted_counts(levels)
+
+        return cls(
+            total_careers=len(store),
+            category_counts=_sorted_counts(category_counts),
+            skill_counts=_sorted_counts(skill_counts),
+            experience_counts=_sorted_counts(experience_counts),
+            category_skill_counts=category_skill_counts,
+            category_experience_counts=category_experience_counts,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON-serializable form for catalog snapshots. Counts are lists of
+        [value, count] pairs, since facet values need not be strings.
+        """
+        return {
+            "total_careers": self.total_careers,
+            "category_counts": list(self.category_counts.items()),
+            "skill_counts": list(self.skill_counts.items()),
+            "experience_counts": list(self.experience_counts.items()),
+            "category_skill_counts": [
+                [category, list(counts.items())] for category, counts in self.category_skill_counts.items()
+            ],
+            "category_experience_counts": [
+                [category, list(counts.items())] for category, counts in self.category_experience_counts.items()
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FacetIndex":
+        """Facets restored from to_dict output."""
+        return cls(
+            total_careers=data["total_careers"],
+            category_counts=dict(data["category_counts"]),
+            skill_counts=dict(data["skill_counts"]),
+            experience_counts=dict(data["experience_counts"]),
+            category_skill_counts={category: dict(counts) for category, counts in data["category_skill_counts"]},
+            category_experience_counts={
+                category: dict(counts) for category, counts in data["category_experience_counts"]
+            },
+        )
+
+    @property
+    def categories(self) -> List[str]:
+        """Sorted distinct non-empty categories."""
+        return list(self.category_counts)
+
+    def skills(self, category: Optional[str] = None) -> Dict[str, int]:
+        """Careers per skill (sorted by skill), optionally within one category."""
+        if category is None:
+            return self.skill_counts
+        return self.category_skill_counts.get(category, {})
+
+    def experience_levels(self, category: Optional[str] = None) -> Dict[str, int]:
+        """Careers per experience level (sorted by level), optionally within one category."""
+        if category is None:
+            return self.experience_counts
+        return self.category_experience_counts.get(category, {})
@@ -0,0 +1,77 @@
+"""
+Learning Plan Module
+Ranks the skills a user could learn next by how much each one would raise
+their top recommendations.
+"""
+
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import numpy as np
+
+from scoring_session import ScoringSession
+from vectorized_scoring import top_positions
+
+
+@dataclass
+class SkillUplift:
+    """Effect of learning one more skill."""
+    skill: str
+    score_gain: float
+    careers_improved: int
+
+
+def plan_learning(session: ScoringSession, k: int = 3, max_skills: int = 3,
+                  num_suggestions: int = 10) -> Tuple[List[SkillUplift], List[SkillUplift]]:
+    """
+    Evaluate every catalog skill the user lacks and build a learning plan.
+
+    A skill's gain is the increase of the summed scores of the user's top k
+    careers if they matched it exactly, computed from the careers requiring
+    it only (so a short skill like "r" does not score through the partial
+    matches its name would add). The plan is greedy: it repeatedly adds the
+    skill with the largest gain given the skills already planned, until
+    `max_skills` skills are planned or no skill raises the top k any further.
+    The session is advanced by each planned skill.
+
+    Args:
+        session: Scoring session of the user's assessment
+        k: Number of top careers whose scores should rise
+        max_skills: Maximum number of skills in the plan
+        num_suggestions: Number of best single skills to return
+
+    Returns:
+        Tuple of (best single skills, plan), both best first
+    """
+    index = session.snapshot.index
+    candidates = np.array([
+        skill_id for skill_id, name in enumerate(index.skill_names)
+        if name and skill_id not in session.inputs.exact_ids
+    ], dtype=np.int64)
+
+    suggestions = None
+    plan = []
+    for _ in range(max_skills):
+        top, _ = top_positions(session.scores, k)
+        gains, improved = session.skill_gains(candidates, top)
+        # Stable sort, so equal gains keep vocabulary order
+        order = np.argsort(-np.round(gains, 9), kind="stable")
+        order = order[gains[order] > 1e-9]
+        uplifts = [
+            SkillUplift(
+                skill=index.skill_names[candidates[i]],
+                score_gain=round(float(gains[i]), 3),
+                careers_improved=int(improved[i])
+            )
+            for i in order[:max(num_suggestions, 1)]
+        ]
+
+        if suggestions is None:
+            suggestions = uplifts[:num_suggestions]
+        if not uplifts:
+            break
+        plan.append(uplifts[0])
+        session.add_skill(uplifts[0].skill)
+        candidates = np.delete(candidates, order[0])
+
+    return suggestions or [], plan
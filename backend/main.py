@@ -1,9 +1,21 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Header, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
-from recommendation_engine import RecommendationEngine, CareerMatch
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ValidationError
+from typing import List, Optional, Dict, Any, Tuple
+from recommendation_engine import RecommendationEngine, CareerMatch, file_stamp
+from scoring_session import ScoringSession
+from scoring_executor import ScoringExecutor, ExecutorSaturated, server_timing
+from single_flight import SingleFlight
+from precompressed import VersionedResponse, serve_versioned
+from career_store import CAREER_FIELDS
+from skill_suggester import MAX_SUGGESTIONS
+from career_neighbors import DEFAULT_NEIGHBORS
+from bisect import bisect_right
+import base64
 import json
+import os
 
 app = FastAPI(title="Smart India Hackathon Backend", version="1.0.0")
 
@@ -16,8 +28,51 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize recommendation engine
-recommendation_engine = RecommendationEngine()
+# Initialize recommendation engine ("python", "numpy" or "sharded" scoring backend)
+recommendation_engine = RecommendationEngine(
+    careers_file=os.getenv("CAREERS_FILE", "../careers.json"),
+    scoring_backend=os.getenv("SCORING_BACKEND", "python"),
+    cache_size=int(os.getenv("RESULT_CACHE_SIZE", "1024")),
+    cache_ttl=float(os.getenv("RESULT_CACHE_TTL", "300")),
+    num_shards=int(os.getenv("SCORING_SHARDS", "0")) or None,
+    text_similarity=os.getenv("TEXT_SIMILARITY", "1") != "0",
+    typo_tolerance=os.getenv("SKILL_TYPO_TOLERANCE", "1") != "0",
+    similar_careers=os.getenv("SIMILAR_CAREERS", "0") != "0"
+)
+
+# Seconds between checks of the careers file for changes (0 disables the watcher)
+CAREERS_RELOAD_INTERVAL = float(os.getenv("CAREERS_RELOAD_INTERVAL", "5"))
+
+# True in scoring worker processes, which run their own engine
+_in_scoring_worker = False
+
+def _init_scoring_worker():
+    """Mark this process as a scoring worker; its catalog follows the parent's through _sync_catalog."""
+    global _in_scoring_worker
+    _in_scoring_worker = True
+
+# Scoring runs in a "thread" or "process" pool off the event loop; beyond
+# SCORING_QUEUE_SIZE requests in flight, new ones are rejected with 503
+SCORING_EXECUTOR = os.getenv("SCORING_EXECUTOR", "thread")
+if SCORING_EXECUTOR == "process" and recommendation_engine.scoring_backend == "sharded":
+    raise ValueError("SCORING_EXECUTOR=process cannot be combined with SCORING_BACKEND=sharded")
+scoring_executor = ScoringExecutor(
+    kind=SCORING_EXECUTOR,
+    max_workers=int(os.getenv("SCORING_WORKERS", "0")) or None,
+    max_pending=int(os.getenv("SCORING_QUEUE_SIZE", "64")),
+    initializer=_init_scoring_worker if SCORING_EXECUTOR == "process" else None
+)
+
+# Identical /recommend requests arriving together share one computation
+recommendation_flights = SingleFlight()
+
+# Catalog listings, serialized and compressed once per catalog snapshot
+careers_response = VersionedResponse()
+categories_response = VersionedResponse()
+skills_response = VersionedResponse()
+
+# When set, /admin endpoints require a matching X-Admin-Token header
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
 
 # Pydantic models for request/response
 class UserAssessment(BaseModel):
@@ -42,6 +97,145 @@ class RecommendationResponse(BaseModel):
     recommendations: List[CareerRecommendation]
     total_careers_analyzed: int
     user_profile: UserAssessment
+    next_offset: Optional[int] = None
+
+class SkillUpliftResponse(BaseModel):
+    skill: str
+    score_gain: float
+    careers_improved: int
+
+class LearningPlanResponse(BaseModel):
+    suggestions: List[SkillUpliftResponse]
+    plan: List[SkillUpliftResponse]
+    user_profile: UserAssessment
+
+class BatchRecommendationRequest(BaseModel):
+    assessments: List[UserAssessment]
+    k: int = 3
+
+class BatchRecommendationResponse(BaseModel):
+    results: List[RecommendationResponse]
+    total_assessments: int
+
+# Upper bound on assessments per batch request to keep memory per request bounded
+MAX_BATCH_SIZE = 1000
+
+# Upper bound on recommendations returned per page
+MAX_RECOMMENDATIONS = 100
+
+# Upper bound on skills in a learning plan
+MAX_PLAN_SKILLS = 5
+
+# Page size limits for /api/careers listings
+DEFAULT_CAREERS_PAGE = 100
+MAX_CAREERS_PAGE = 1000
+
+# Careers serialized per chunk of an NDJSON stream
+NDJSON_CHUNK_SIZE = 256
+
+def _to_user_data(user_assessment: UserAssessment) -> Dict[str, Any]:
+    """Convert a UserAssessment into the dictionary the engine expects."""
+    return {
+        "skills": user_assessment.skills,
+        "interests": user_assessment.interests,
+        "experience_level": user_assessment.experience_level,
+        "preferred_categories": user_assessment.preferred_categories or []
+    }
+
+def _sync_catalog(catalog_stamp: Optional[Tuple[float, int]]) -> None:
+    """
+    Reload a process worker's catalog if the parent serves a different careers file.
+    
+    Reloads in the parent (watcher or /admin/reload) do not reach worker
+    processes, so every job carries the (mtime, size) stamp of the parent's
+    catalog. A worker whose catalog differs reloads, unless the file on disk
+    is still the one it has (the parent is behind the file, not the worker).
+    Thread workers share the parent's engine and skip this.
+    """
+    if not _in_scoring_worker:
+        return
+    snapshot = recommendation_engine.snapshot
+    if catalog_stamp == snapshot.source_stamp or snapshot.source_path is None:
+        return
+    try:
+        current_stamp = file_stamp(snapshot.source_path)
+    except OSError:
+        return
+    if current_stamp != snapshot.source_stamp:
+        recommendation_engine.reload_careers()
+
+def _recommend(catalog_stamp: Optional[Tuple[float, int]], user_data: Dict[str, Any], k: int, offset: int,
+               mode: str) -> List[CareerMatch]:
+    """Scoring job for /recommend, run in the scoring executor."""
+    _sync_catalog(catalog_stamp)
+    return recommendation_engine.get_recommendations(user_data, k=k, offset=offset, mode=mode)
+
+def _recommend_batch(catalog_stamp: Optional[Tuple[float, int]], users_data: List[Dict[str, Any]],
+                     k: int) -> List[List[CareerMatch]]:
+    """Scoring job for /recommend/batch, run in the scoring executor."""
+    _sync_catalog(catalog_stamp)
+    return recommendation_engine.get_recommendations_batch(users_data, k=k)
+
+def _learning_plan(catalog_stamp: Optional[Tuple[float, int]], user_data: Dict[str, Any], k: int,
+                   max_skills: int):
+    """Scoring job for /recommend/learning-plan, run in the scoring executor."""
+    _sync_catalog(catalog_stamp)
+    return recommendation_engine.get_learning_plan(user_data, k=k, max_skills=max_skills)
+
+async def _run_scoring(response: Response, job, *args, key=None, snapshot=None):
+    """
+    Run a scoring job off the event loop, reporting queue and compute time.
+    
+    Calls with the same `key` that overlap are coalesced into one job whose
+    result every caller receives. The job receives the careers file stamp of
+    `snapshot` (the current one by default, pass the one `key` was derived
+    from) before `args`, so process workers score the same catalog.
+    """
+    catalog_stamp = (snapshot or recommendation_engine.snapshot).source_stamp
+    
+    def score():
+        return scoring_executor.run(job, catalog_stamp, *args)
+    
+    try:
+        if key is None:
+            (result, queue_seconds, compute_seconds), shared = await score(), False
+        else:
+            (result, queue_seconds, compute_seconds), shared = await recommendation_flights.do(key, score)
+    except ExecutorSaturated:
+        raise HTTPException(
+            status_code=503,
+            detail="Server is busy, please retry shortly",
+            headers={"Retry-After": "1"}
+        )
+    timing = server_timing(queue_seconds, compute_seconds)
+    response.headers["Server-Timing"] = timing + ", coalesced" if shared else timing
+    return result
+
+def _to_recommendation(match: CareerMatch) -> CareerRecommendation:
+    """Convert a CareerMatch into a CareerRecommendation."""
+    return CareerRecommendation(
+        id=match.id,
+        title=match.title,
+        category=match.category,
+        description=match.description,
+        match_score=match.match_score,
+        matched_skills=match.matched_skills,
+        missing_skills=match.missing_skills,
+        experience_level=match.experience_level,
+        salary_range=match.salary_range,
+        education=match.education
+    )
+
+@app.on_event("startup")
+async def start_catalog_watcher():
+    if CAREERS_RELOAD_INTERVAL > 0:
+        recommendation_engine.start_auto_reload(CAREERS_RELOAD_INTERVAL)
+    await run_in_threadpool(scoring_executor.warm_up)
+
+@app.on_event("shutdown")
+async def stop_catalog_watcher():
+    recommendation_engine.stop_auto_reload()
+    scoring_executor.shutdown()
 
 @app.get("/")
 async def root():
@@ -55,15 +249,110 @@ async def health_check():
 async def hello():
     return {"message": "Hello from FastAPI backend!"}
 
+def _careers_content(snapshot) -> Dict[str, Any]:
+    careers = snapshot.index.store.to_list()
+    return {
+        "careers": careers,
+        "total_count": len(careers)
+    }
+
+def _categories_content(snapshot) -> Dict[str, Any]:
+    counts = snapshot.facets.category_counts
+    return {
+        "categories": list(counts),
+        "total_count": len(counts),
+        "counts": counts
+    }
+
+def _skills_content(snapshot, category: Optional[str] = None) -> Dict[str, Any]:
+    counts = snapshot.facets.skills(category)
+    return {
+        "skills": list(counts),
+        "total_count": len(counts),
+        "counts": counts
+    }
+
+def _encode_cursor(version: int, position: int) -> str:
+    return base64.urlsafe_b64encode(f"{version}:{position}".encode()).decode().rstrip("=")
+
+def _decode_cursor(cursor: str, version: int) -> int:
+    """Position after which a listing resumes; the cursor must come from the current catalog."""
+    try:
+        cursor_version, position = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode().split(":")
+        cursor_version, position = int(cursor_version), int(position)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if cursor_version != version:
+        raise HTTPException(status_code=410, detail="The catalog changed since this cursor was issued, restart the listing")
+    return position
+
+def _parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    if fields is None:
+        return None
+    selected = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in selected if field not in CAREER_FIELDS]
+    if unknown or not selected:
+        raise HTTPException(status_code=400, detail=f"fields must be a comma-separated subset of {', '.join(CAREER_FIELDS)}")
+    return selected
+
 @app.get("/api/careers")
-async def get_all_careers():
-    """Get all available careers."""
+async def get_all_careers(request: Request, limit: Optional[int] = None, cursor: Optional[str] = None,
+                          fields: Optional[str] = None, category: Optional[str] = None,
+                          experience_level: Optional[str] = None, format: str = "json"):
+    """
+    Get all available careers.
+    
+    Without parameters the whole catalog is returned; that body is
+    serialized and compressed once per catalog snapshot and served with an
+    ETag (send If-None-Match to get 304 when unchanged).
+    
+    With any parameter the listing is paged: `limit` careers (default 100,
+    at most 1000) after `cursor`, restricted to `category` and/or
+    `experience_level` and to the comma-separated `fields`. The response's
+    next_cursor continues the listing. format=ndjson instead streams every
+    matching career after `cursor` as one JSON object per line.
+    """
     try:
-        careers = recommendation_engine.get_all_careers()
+        snapshot = recommendation_engine.snapshot
+        paged = any(value is not None for value in (limit, cursor, fields, category, experience_level))
+        if format == "json" and not paged:
+            return await serve_versioned(request, careers_response, snapshot.version,
+                                         lambda: _careers_content(snapshot))
+        if format not in ("json", "ndjson"):
+            raise HTTPException(status_code=400, detail="format must be json or ndjson")
+        if limit is not None and (limit < 1 or limit > MAX_CAREERS_PAGE):
+            raise HTTPException(status_code=400, detail=f"limit must be between 1 and {MAX_CAREERS_PAGE}")
+        
+        index = snapshot.index
+        store = index.store
+        selected_fields = _parse_fields(fields)
+        positions = index.positions_where(category=category, experience_level=experience_level)
+        start = 0
+        if cursor is not None:
+            start = bisect_right(positions, _decode_cursor(cursor, snapshot.version))
+        
+        if format == "ndjson":
+            stop = len(positions) if limit is None else min(len(positions), start + limit)
+            
+            def stream():
+                for chunk_start in range(start, stop, NDJSON_CHUNK_SIZE):
+                    chunk = positions[chunk_start:min(chunk_start + NDJSON_CHUNK_SIZE, stop)]
+                    yield "".join(
+                        json.dumps(store.get(position, selected_fields), ensure_ascii=False) + "\n"
+                        for position in chunk
+                    ).encode("utf-8")
+            
+            return StreamingResponse(stream(), media_type="application/x-ndjson")
+        
+        page = positions[start:start + (limit or DEFAULT_CAREERS_PAGE)]
+        has_more = start + len(page) < len(positions)
         return {
-            "careers": careers,
-            "total_count": len(careers)
+            "careers": [store.get(position, selected_fields) for position in page],
+            "total_count": len(positions),
+            "next_cursor": _encode_cursor(snapshot.version, page[-1]) if has_more else None
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching careers: {str(e)}")
 
@@ -80,13 +369,33 @@ async def get_career_by_id(career_id: int):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching career: {str(e)}")
 
+@app.get("/api/careers/{career_id}/similar")
+async def get_similar_careers(career_id: int, limit: int = 10):
+    """Get the careers most similar to a career by shared skills and category."""
+    if limit <= 0 or limit > DEFAULT_NEIGHBORS:
+        raise HTTPException(status_code=400, detail=f"limit must be between 1 and {DEFAULT_NEIGHBORS}")
+    
+    try:
+        similar = recommendation_engine.get_similar_careers(career_id, limit)
+    except ValueError as e:
+        # The feature is disabled on this server (SIMILAR_CAREERS=0)
+        raise HTTPException(status_code=404, detail=str(e))
+    if similar is None:
+        raise HTTPException(status_code=404, detail="Career not found")
+    return {"career_id": career_id, "similar_careers": similar, "total_count": len(similar)}
+
 @app.post("/recommend", response_model=RecommendationResponse)
-async def get_recommendations(user_assessment: UserAssessment):
+async def get_recommendations(user_assessment: UserAssessment, response: Response, k: int = 3,
+                              offset: int = 0, mode: str = "skills"):
     """
     Get career recommendations based on user assessment.
     
-    Accepts user responses as JSON and returns top 3 career matches
-    with match scores and skill gaps.
+    Accepts user responses as JSON and returns the top k career matches
+    (3 by default) with match scores and skill gaps. Pass the returned
+    next_offset as offset to fetch the following page. With mode=text,
+    careers are ranked by similarity of their description and skills to
+    the user's skills and interests. The Server-Timing header reports time
+    spent queued for a scoring worker and time spent scoring.
     """
     try:
         # Validate input
@@ -95,69 +404,306 @@ async def get_recommendations(user_assessment: UserAssessment):
                 status_code=400, 
                 detail="At least one skill or interest must be provided"
             )
+        if k < 1 or k > MAX_RECOMMENDATIONS:
+            raise HTTPException(status_code=400, detail=f"k must be between 1 and {MAX_RECOMMENDATIONS}")
+        if offset < 0:
+            raise HTTPException(status_code=400, detail="offset must not be negative")
+        if mode not in RecommendationEngine.SCORING_MODES:
+            raise HTTPException(status_code=400, detail=f"mode must be one of {', '.join(RecommendationEngine.SCORING_MODES)}")
+        if mode == "text" and recommendation_engine.snapshot.text_index is None:
+            raise HTTPException(status_code=400, detail="Text similarity scoring is disabled")
         
         # Get recommendations from engine
-        career_matches = recommendation_engine.get_recommendations({
-            "skills": user_assessment.skills,
-            "interests": user_assessment.interests,
-            "experience_level": user_assessment.experience_level,
-            "preferred_categories": user_assessment.preferred_categories or []
-        })
+        user_data = _to_user_data(user_assessment)
+        snapshot = recommendation_engine.snapshot
+        career_matches = await _run_scoring(
+            response, _recommend, user_data, k, offset, mode,
+            key=recommendation_engine.recommendation_key(user_data, k, offset, mode, snapshot), snapshot=snapshot
+        )
         
         # Convert CareerMatch objects to CareerRecommendation objects
-        recommendations = []
-        for match in career_matches:
-            recommendations.append(CareerRecommendation(
-                id=match.id,
-                title=match.title,
-                category=match.category,
-                description=match.description,
-                match_score=match.match_score,
-                matched_skills=match.matched_skills,
-                missing_skills=match.missing_skills,
-                experience_level=match.experience_level,
-                salary_range=match.salary_range,
-                education=match.education
-            ))
+        recommendations = [_to_recommendation(match) for match in career_matches]
+        
+        total_careers = recommendation_engine.count_careers()
+        next_offset = offset + k if offset + k < total_careers else None
         
         return RecommendationResponse(
             recommendations=recommendations,
-            total_careers_analyzed=len(recommendation_engine.get_all_careers()),
-            user_profile=user_assessment
+            total_careers_analyzed=total_careers,
+            user_profile=user_assessment,
+            next_offset=next_offset
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error generating recommendations: {str(e)}")
+
+@app.post("/recommend/batch", response_model=BatchRecommendationResponse)
+async def get_recommendations_batch(batch_request: BatchRecommendationRequest, response: Response):
+    """
+    Get career recommendations for many assessments in one request.
+    
+    All assessments are scored together against the catalog and each one
+    gets its own top k matches, in the same order as the input.
+    """
+    try:
+        assessments = batch_request.assessments
+        if len(assessments) > MAX_BATCH_SIZE:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {MAX_BATCH_SIZE} assessments can be scored per request"
+            )
+        if batch_request.k < 1 or batch_request.k > MAX_RECOMMENDATIONS:
+            raise HTTPException(status_code=400, detail=f"k must be between 1 and {MAX_RECOMMENDATIONS}")
+        
+        for position, user_assessment in enumerate(assessments):
+            if not user_assessment.skills and not user_assessment.interests:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Assessment {position}: at least one skill or interest must be provided"
+                )
+        
+        batch_matches = await _run_scoring(
+            response, _recommend_batch,
+            [_to_user_data(user_assessment) for user_assessment in assessments], batch_request.k
         )
         
+        total_careers = recommendation_engine.count_careers()
+        results = [
+            RecommendationResponse(
+                recommendations=[_to_recommendation(match) for match in career_matches],
+                total_careers_analyzed=total_careers,
+                user_profile=user_assessment
+            )
+            for user_assessment, career_matches in zip(assessments, batch_matches)
+        ]
+        
+        return BatchRecommendationResponse(results=results, total_assessments=len(results))
+        
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating recommendations: {str(e)}")
 
+@app.post("/recommend/learning-plan", response_model=LearningPlanResponse)
+async def get_learning_plan(user_assessment: UserAssessment, response: Response, k: int = 3,
+                            max_skills: int = 3):
+    """
+    Get the skills that would raise the user's top k recommendations the most.
+    
+    `suggestions` ranks single skills by the increase of the summed scores
+    of the top k careers; `plan` adds up to max_skills skills one at a time,
+    each chosen given the ones before it. Only careers requiring a skill are
+    rescored to evaluate it.
+    """
+    try:
+        if not user_assessment.skills and not user_assessment.interests:
+            raise HTTPException(
+                status_code=400,
+                detail="At least one skill or interest must be provided"
+            )
+        if k < 1 or k > MAX_RECOMMENDATIONS:
+            raise HTTPException(status_code=400, detail=f"k must be between 1 and {MAX_RECOMMENDATIONS}")
+        if max_skills < 1 or max_skills > MAX_PLAN_SKILLS:
+            raise HTTPException(status_code=400, detail=f"max_skills must be between 1 and {MAX_PLAN_SKILLS}")
+        
+        suggestions, plan = await _run_scoring(
+            response, _learning_plan, _to_user_data(user_assessment), k, max_skills
+        )
+        
+        return LearningPlanResponse(
+            suggestions=[SkillUpliftResponse(**vars(uplift)) for uplift in suggestions],
+            plan=[SkillUpliftResponse(**vars(uplift)) for uplift in plan],
+            user_profile=user_assessment
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error generating learning plan: {str(e)}")
+
+def _open_session(user_data: Dict[str, Any], k: int, offset: int) -> Tuple[ScoringSession, Dict[str, Any]]:
+    """Scoring job creating a live session and its first response."""
+    session = recommendation_engine.create_session(user_data)
+    return session, _session_response(session, k, offset)
+
+def _edit_session(session: ScoringSession, action: str, value: Any, k: int, offset: int) -> Dict[str, Any]:
+    """Scoring job applying one live session edit (a skill, or a UserAssessment for "update")."""
+    if action == "add_skill":
+        session.add_skill(value)
+    elif action == "remove_skill":
+        session.remove_skill(value)
+    else:
+        session.update_profile(
+            interests=value.interests,
+            experience_level=value.experience_level,
+            preferred_categories=value.preferred_categories or []
+        )
+    return _session_response(session, k, offset)
+
+def _session_response(session: ScoringSession, k: int, offset: int) -> Dict[str, Any]:
+    """RecommendationResponse for a live session, as JSON-ready data."""
+    career_matches = session.recommendations(k=k, offset=offset)
+    total_careers = recommendation_engine.count_careers()
+    return RecommendationResponse(
+        recommendations=[_to_recommendation(match) for match in career_matches],
+        total_careers_analyzed=total_careers,
+        user_profile=UserAssessment(**session.user_data()),
+        next_offset=offset + k if offset + k < total_careers else None
+    ).model_dump()
+
+@app.websocket("/ws/recommend")
+async def live_recommendations(websocket: WebSocket, k: int = 3):
+    """
+    Live recommendations that refresh as the user edits their assessment.
+    
+    The first message is a UserAssessment. Each following message is one of
+    {"action": "add_skill", "skill": ...}, {"action": "remove_skill", "skill": ...}
+    or {"action": "update", "interests": [...], "experience_level": ...,
+    "preferred_categories": [...]}, optionally with "k" and "offset". Every
+    message is answered with a RecommendationResponse for the current
+    assessment; skill edits only rescore careers requiring those skills.
+    Scoring runs in the scoring executor's threads; when it is saturated the
+    message is answered with an error and the session is left unchanged.
+    """
+    await websocket.accept()
+    k = max(1, min(k, MAX_RECOMMENDATIONS))
+    offset = 0
+    
+    try:
+        try:
+            user_assessment = UserAssessment(**await websocket.receive_json())
+        except (ValidationError, TypeError, ValueError) as e:
+            await websocket.send_json({"error": f"Invalid assessment: {str(e)}"})
+            await websocket.close(code=1003)
+            return
+        try:
+            (session, reply), _, _ = await scoring_executor.run(
+                _open_session, _to_user_data(user_assessment), k, offset, local=True
+            )
+        except ExecutorSaturated:
+            await websocket.send_json({"error": "Server is busy, please retry shortly"})
+            await websocket.close(code=1013)
+            return
+        await websocket.send_json(reply)
+        
+        while True:
+            message = await websocket.receive_json()
+            action = message.get("action") if isinstance(message, dict) else None
+            if action not in ("add_skill", "remove_skill", "update"):
+                await websocket.send_json({"error": "action must be add_skill, remove_skill or update"})
+                continue
+            
+            try:
+                k = max(1, min(int(message.get("k", k)), MAX_RECOMMENDATIONS))
+                offset = max(0, int(message.get("offset", offset)))
+                if action == "update":
+                    profile = UserAssessment(**{**session.user_data(), **{
+                        field: message[field] for field in ("interests", "experience_level", "preferred_categories")
+                        if field in message
+                    }})
+            except (ValidationError, TypeError, ValueError) as e:
+                await websocket.send_json({"error": f"Invalid update: {str(e)}"})
+                continue
+            
+            value = profile if action == "update" else str(message.get("skill", ""))
+            try:
+                reply, _, _ = await scoring_executor.run(_edit_session, session, action, value, k, offset, local=True)
+            except ExecutorSaturated:
+                await websocket.send_json({"error": "Server is busy, please retry shortly"})
+                continue
+            await websocket.send_json(reply)
+    except WebSocketDisconnect:
+        pass
+
+@app.post("/admin/reload")
+async def reload_careers(x_admin_token: Optional[str] = Header(None)):
+    """
+    Reload careers.json into a new catalog snapshot.
+    
+    The snapshot is compiled in a worker thread and swapped in atomically;
+    in-flight requests finish on the previous snapshot.
+    """
+    if ADMIN_TOKEN and x_admin_token != ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+    
+    reloaded = await run_in_threadpool(recommendation_engine.reload_careers)
+    if not reloaded:
+        raise HTTPException(
+            status_code=500,
+            detail="Error reloading careers data, the previous catalog is still being served"
+        )
+    
+    return {
+        "status": "reloaded",
+        "catalog_version": recommendation_engine.snapshot.version,
+        "total_count": recommendation_engine.count_careers()
+    }
+
+@app.get("/api/cache/stats")
+async def get_cache_stats():
+    """Get recommendation result cache counters."""
+    return recommendation_engine.get_cache_stats()
+
+@app.get("/api/scoring/stats")
+async def get_scoring_stats():
+    """Get scoring executor load counters (in flight, rejected, queue vs compute time)."""
+    return {**scoring_executor.stats(), **recommendation_flights.stats()}
+
 @app.get("/api/categories")
-async def get_career_categories():
-    """Get all available career categories."""
+async def get_career_categories(request: Request):
+    """Get all available career categories with careers per category (precompressed, with ETag)."""
     try:
-        careers = recommendation_engine.get_all_careers()
-        categories = list(set(career.get("category", "") for career in careers if career.get("category")))
-        return {
-            "categories": sorted(categories),
-            "total_count": len(categories)
-        }
+        snapshot = recommendation_engine.snapshot
+        return await serve_versioned(request, categories_response, snapshot.version,
+                                     lambda: _categories_content(snapshot))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching categories: {str(e)}")
 
+@app.get("/api/facets")
+async def get_facets(category: Optional[str] = None):
+    """
+    Get filter facet counts from the catalog's facet index.
+    
+    Category counts always cover the whole catalog; skill and experience
+    level counts are restricted to `category` when given.
+    """
+    facets = recommendation_engine.snapshot.facets
+    return {
+        "category": category,
+        "total_careers": facets.category_counts.get(category, 0) if category is not None else facets.total_careers,
+        "categories": facets.category_counts,
+        "skills": facets.skills(category),
+        "experience_levels": facets.experience_levels(category)
+    }
+
+@app.get("/api/skills/suggest")
+async def suggest_skills(q: str = "", limit: int = 10):
+    """
+    Autocomplete skills: catalog skills whose name, a word of it, or one of
+    its synonyms starts with `q`, most widely required first.
+    """
+    if limit <= 0 or limit > MAX_SUGGESTIONS:
+        raise HTTPException(status_code=400, detail=f"limit must be between 1 and {MAX_SUGGESTIONS}")
+    
+    suggestions = recommendation_engine.snapshot.skill_suggester.suggest(q, limit)
+    return {
+        "query": q,
+        "suggestions": [{"skill": skill, "count": count} for skill, count in suggestions]
+    }
+
 @app.get("/api/skills")
-async def get_all_skills():
-    """Get all unique skills from all careers."""
+async def get_all_skills(request: Request, category: Optional[str] = None):
+    """
+    Get all unique skills from all careers with careers per skill
+    (precompressed, with ETag), or only the skills of one category.
+    """
     try:
-        careers = recommendation_engine.get_all_careers()
-        all_skills = set()
-        
-        for career in careers:
-            skills = career.get("required_skills", [])
-            all_skills.update(skills)
-        
-        return {
-            "skills": sorted(list(all_skills)),
-            "total_count": len(all_skills)
-        }
+        snapshot = recommendation_engine.snapshot
+        if category is not None:
+            return _skills_content(snapshot, category)
+        return await serve_versioned(request, skills_response, snapshot.version,
+                                     lambda: _skills_content(snapshot))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching skills: {str(e)}")
@@ -0,0 +1,132 @@
+"""
+Precompressed Responses Module
+JSON bodies serialized and compressed once per catalog version, served with
+strong ETags and 304 Not Modified handling.
+"""
+
+import gzip
+import hashlib
+import json
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.concurrency import run_in_threadpool
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+# Preferred content codings, best first
+ENCODINGS = ("br", "gzip")
+
+
+def _accepted_encodings(accept_encoding: str) -> Dict[str, float]:
+    """Parse an Accept-Encoding header into {coding: q}."""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+
+class PrecompressedJSON:
+    """
+    A JSON document encoded once, with gzip and (when available) brotli variants.
+
+    Every variant has its own strong ETag derived from the uncompressed body,
+    so caches never confuse encodings while one revalidation works for all.
+    """
+
+    def __init__(self, content: Any):
+        # Same serialization as FastAPI's JSONResponse
+        body = json.dumps(
+            content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+        ).encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest()[:32]
+
+        self.variants: Dict[str, Tuple[bytes, str]] = {
+            "identity": (body, f'"{digest}"'),
+            "gzip": (gzip.compress(body, compresslevel=9, mtime=0), f'"{digest}-gzip"'),
+        }
+        if brotli is not None:
+            self.variants["br"] = (brotli.compress(body, quality=9), f'"{digest}-br"')
+        self._etags = {etag for _, etag in self.variants.values()}
+
+    def _choose_encoding(self, accept_encoding: str) -> str:
+        accepted = _accepted_encodings(accept_encoding)
+        for encoding in ENCODINGS:
+            if encoding in self.variants and accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+                return encoding
+        return "identity"
+
+    def _not_modified(self, if_none_match: str) -> bool:
+        """Weak comparison of If-None-Match against any of our variants."""
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            if tag == "*" or tag.removeprefix("W/") in self._etags:
+                return True
+        return False
+
+    def response(self, request: Request) -> Response:
+        """The variant `request` accepts, or 304 if the client already has it."""
+        encoding = self._choose_encoding(request.headers.get("accept-encoding", ""))
+        body, etag = self.variants[encoding]
+        headers = {"ETag": etag, "Vary": "Accept-Encoding", "Cache-Control": "no-cache"}
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and self._not_modified(if_none_match):
+            return Response(status_code=304, headers=headers)
+
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return Response(content=body, media_type="application/json", headers=headers)
+
+
+class VersionedResponse:
+    """One PrecompressedJSON per catalog version, rebuilt only when the version changes."""
+
+    def __init__(self):
+        self._entry: Optional[Tuple[Hashable, PrecompressedJSON]] = None
+        self._lock = threading.Lock()
+
+    def current(self, version: Hashable) -> Optional[PrecompressedJSON]:
+        """The body for `version` if it is already built."""
+        entry = self._entry
+        return entry[1] if entry is not None and entry[0] == version else None
+
+    def get(self, version: Hashable, build: Callable[[], Any]) -> PrecompressedJSON:
+        """
+        The body for `version`, serializing and compressing it if needed (blocking).
+
+        Args:
+            version: Catalog version the content belongs to
+            build: Returns the JSON content for that version
+        """
+        with self._lock:
+            body = self.current(version)
+            if body is None:
+                body = PrecompressedJSON(build())
+                self._entry = (version, body)
+            return body
+
+
+async def serve_versioned(request: Request, cached: VersionedResponse, version: Hashable,
+                          build: Callable[[], Any]) -> Response:
+    """Serve `cached` for `version`, building it in a worker thread on first use."""
+    body = cached.current(version)
+    if body is None:
+        body = await run_in_threadpool(cached.get, version, build)
+    return body.response(request)
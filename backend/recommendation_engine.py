@@ -3,15 +3,39 @@ Recommendation Engine Module
 Computes match scores between user responses and career requirements.
 """
 
+import heapq
 import json
 import os
-from typing import List, Dict, Any, Tuple
+import threading
+from typing import List, Dict, Any, Tuple, Optional, Sequence, Union
 from dataclasses import dataclass
 import math
 
+import numpy as np
+
+from career_store import CareerStore
+from career_index import CareerIndex, ScoringInputs, EXPERIENCE_RANKS, parse_experience_level
+from skill_matcher import COMMON_SKILL_KEYWORDS, build_synonym_lookup
+from vectorized_scoring import VectorizedScorer, round_scores
+from sharded_scoring import ShardedScorer
+from text_similarity import TextSimilarityIndex
+from scoring_session import ScoringSession
+from learning_plan import SkillUplift, plan_learning
+from facet_index import FacetIndex
+from skill_suggester import SkillSuggester
+from career_neighbors import CareerNeighbors
+from result_cache import ResultCache
+from catalog_watcher import CatalogWatcher
+from catalog_snapshot import is_catalog_snapshot, read_catalog_snapshot, write_catalog_snapshot
+
 @dataclass
 class CareerMatch:
     """Data class for career match results."""
+    __slots__ = (
+        "id", "title", "category", "description", "match_score", "matched_skills",
+        "missing_skills", "experience_level", "salary_range", "education"
+    )
+    
     id: int
     title: str
     category: str
@@ -23,44 +47,295 @@ class CareerMatch:
     salary_range: str
     education: str
 
+def file_stamp(path: str) -> Tuple[float, int]:
+    """(mtime, size) of a file, used to tell versions of the careers file apart."""
+    stat = os.stat(path)
+    return stat.st_mtime, stat.st_size
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """Fully compiled catalog state, replaced as a whole when careers.json is reloaded."""
+    index: CareerIndex
+    scorer: Optional[Union[VectorizedScorer, ShardedScorer]]
+    text_index: Optional[TextSimilarityIndex]
+    facets: FacetIndex
+    skill_suggester: SkillSuggester
+    neighbors: Optional[CareerNeighbors]
+    version: int
+    source_path: Optional[str]
+    source_stamp: Optional[Tuple[float, int]]
+
 class RecommendationEngine:
     """Engine for computing career recommendations based on user input."""
     
-    def __init__(self, careers_file: str = "../careers.json"):
-        """Initialize the recommendation engine with careers data."""
-        self.careers_data = self._load_careers_data(careers_file)
+    SCORING_BACKENDS = ("python", "numpy", "sharded")
+    SCORING_MODES = ("skills", "text")
+    
+    def __init__(self, careers_file: str = "../careers.json", scoring_backend: str = "python",
+                 cache_size: int = 1024, cache_ttl: float = 300.0, num_shards: Optional[int] = None,
+                 text_similarity: bool = True, typo_tolerance: bool = True, similar_careers: bool = False):
+        """
+        Initialize the recommendation engine with careers data.
+        
+        Args:
+            careers_file: Path to the careers JSON file, or to a binary catalog
+                snapshot written by save_catalog_snapshot
+            scoring_backend: "python" scores candidate careers one at a time,
+                "numpy" scores the whole catalog with array operations,
+                "sharded" does the same split across a pool of worker processes
+            cache_size: Maximum number of cached recommendation results (0 disables the cache)
+            cache_ttl: Seconds a cached result stays valid
+            num_shards: Catalog shards (and worker processes) for the "sharded"
+                backend, defaults to the CPU count
+            text_similarity: Build the TF-IDF index used by the "text" scoring mode
+            typo_tolerance: Correct misspelled user skills to the closest catalog
+                skill or synonym within a small edit distance
+            similar_careers: Precompute each career's most similar careers (off by
+                default, the precompute adds seconds per 100,000 careers to each load)
+        """
+        if scoring_backend not in self.SCORING_BACKENDS:
+            raise ValueError(f"Unknown scoring backend: {scoring_backend}")
+        
+        self.careers_file = careers_file
+        self.scoring_backend = scoring_backend
+        self.num_shards = num_shards
+        self.text_similarity = text_similarity
+        self.typo_tolerance = typo_tolerance
+        self.similar_careers = similar_careers
         self.skill_synonyms = self._create_skill_synonyms()
+        self.synonym_lookup = build_synonym_lookup(self.skill_synonyms)
+        self.interest_category_mapping = self._create_interest_category_mapping()
+        self.result_cache = ResultCache(cache_size, cache_ttl)
+        self._batch_scorer: Optional[Tuple[int, VectorizedScorer]] = None
+        self._reload_lock = threading.Lock()
+        self._watcher: Optional[CatalogWatcher] = None
+        
+        source_path = self._resolve_careers_path(careers_file)
+        source_stamp = file_stamp(source_path) if source_path else None
+        if source_path is not None and is_catalog_snapshot(source_path):
+            self.snapshot = self._load_catalog_snapshot(source_path, source_stamp, version=1)
+        else:
+            careers_data = self._load_careers_data(careers_file)
+            self.snapshot = self._build_snapshot(careers_data, source_path, source_stamp, version=1)
+    
+    @property
+    def index(self) -> CareerIndex:
+        """Compiled index of the current catalog snapshot."""
+        return self.snapshot.index
+    
+    @property
+    def careers_data(self) -> List[Dict[str, Any]]:
+        """Careers of the current catalog snapshot, as dictionaries."""
+        return self.snapshot.index.store.to_list()
+    
+    def _resolve_careers_path(self, file_path: str) -> Optional[str]:
+        """Find the careers file: as given, next to this module, or in the project root."""
+        # Try relative path first
+        if os.path.exists(file_path):
+            return file_path
+        
+        # Try absolute path from current directory
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        absolute_path = os.path.join(current_dir, file_path)
+        
+        if os.path.exists(absolute_path):
+            return absolute_path
+        
+        # Try from project root
+        project_root = os.path.join(current_dir, '..')
+        root_path = os.path.join(project_root, 'careers.json')
+        
+        if os.path.exists(root_path):
+            return root_path
+        
+        return None
     
     def _load_careers_data(self, file_path: str) -> List[Dict[str, Any]]:
         """Load careers data from JSON file."""
         try:
-            # Try relative path first
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    return json.load(file)
-            
-            # Try absolute path from current directory
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            absolute_path = os.path.join(current_dir, file_path)
-            
-            if os.path.exists(absolute_path):
-                with open(absolute_path, 'r', encoding='utf-8') as file:
-                    return json.load(file)
+            resolved_path = self._resolve_careers_path(file_path)
+            if resolved_path is None:
+                raise FileNotFoundError(f"Careers file not found: {file_path}")
             
-            # Try from project root
-            project_root = os.path.join(current_dir, '..')
-            root_path = os.path.join(project_root, 'careers.json')
-            
-            if os.path.exists(root_path):
-                with open(root_path, 'r', encoding='utf-8') as file:
-                    return json.load(file)
-            
-            raise FileNotFoundError(f"Careers file not found: {file_path}")
+            with open(resolved_path, 'r', encoding='utf-8') as file:
+                return json.load(file)
             
         except Exception as e:
             print(f"Error loading careers data: {e}")
             return []
     
+    def _build_snapshot(self, careers_data: List[Dict[str, Any]], source_path: Optional[str],
+                        source_stamp: Optional[Tuple[float, int]], version: int) -> CatalogSnapshot:
+        """Compile careers into a snapshot ready to serve requests."""
+        known_skills = self.synonym_lookup if self.typo_tolerance else None
+        index = CareerIndex.build(careers_data, self._normalize_skill, known_skills)
+        scorer = None
+        if self.scoring_backend == "numpy":
+            scorer = VectorizedScorer.from_index(index)
+        elif self.scoring_backend == "sharded":
+            scorer = ShardedScorer(index, self.num_shards)
+        text_index = TextSimilarityIndex(index.store) if self.text_similarity else None
+        facets = FacetIndex.build(index.store)
+        return CatalogSnapshot(
+            index=index,
+            scorer=scorer,
+            text_index=text_index,
+            facets=facets,
+            skill_suggester=SkillSuggester(facets.skill_counts, self.synonym_lookup, self._normalize_skill),
+            neighbors=CareerNeighbors(index) if self.similar_careers else None,
+            version=version,
+            source_path=source_path,
+            source_stamp=source_stamp
+        )
+    
+    def _load_catalog_snapshot(self, path: str, source_stamp: Optional[Tuple[float, int]],
+                               version: int) -> CatalogSnapshot:
+        """
+        Map a binary catalog snapshot written by save_catalog_snapshot.
+        
+        Stored components are restored without visiting any career; only
+        vocabulary-sized structures (skill matcher, typo corrector, skill
+        suggester) are rebuilt. Components this engine's options need but the
+        snapshot lacks are built from the restored store.
+        
+        Raises:
+            ValueError: If the file is not a snapshot of the current format or
+                was compiled with different skill synonyms
+        """
+        arrays, meta = read_catalog_snapshot(path)
+        if meta["synonym_lookup"] != self.synonym_lookup:
+            raise ValueError(f"Catalog snapshot {path} was compiled with different skill synonyms; rebuild it")
+        sections: Dict[str, Dict[str, Any]] = {}
+        for name, values in arrays.items():
+            section, _, array_name = name.partition("/")
+            sections.setdefault(section, {})[array_name] = values
+        
+        store = CareerStore.from_arrays(sections["store"], meta["store"])
+        known_skills = self.synonym_lookup if self.typo_tolerance else None
+        index = CareerIndex.from_arrays(store, sections["index"], meta["index"], known_skills)
+        scorer = None
+        if self.scoring_backend == "numpy":
+            scorer = VectorizedScorer(sections["scorer"], len(index.skill_names))
+        elif self.scoring_backend == "sharded":
+            scorer = ShardedScorer(index, self.num_shards)
+        text_index = None
+        if self.text_similarity:
+            text_index = (
+                TextSimilarityIndex.from_arrays(sections["text"], meta["text"]) if "text" in meta
+                else TextSimilarityIndex(store)
+            )
+        neighbors = None
+        if self.similar_careers:
+            neighbors = (
+                CareerNeighbors.from_arrays(sections["neighbors"]) if "neighbors" in sections
+                else CareerNeighbors(index)
+            )
+        facets = FacetIndex.from_dict(meta["facets"])
+        return CatalogSnapshot(
+            index=index,
+            scorer=scorer,
+            text_index=text_index,
+            facets=facets,
+            skill_suggester=SkillSuggester(facets.skill_counts, self.synonym_lookup, self._normalize_skill),
+            neighbors=neighbors,
+            version=version,
+            source_path=path,
+            source_stamp=source_stamp
+        )
+    
+    def save_catalog_snapshot(self, path: str) -> None:
+        """
+        Write the current catalog as a binary snapshot, which engines load
+        much faster than careers.json when given it as careers_file.
+        
+        The text index and similar-career lists are included if this engine
+        built them; the numpy scorer's arrays are always included.
+        
+        Args:
+            path: Destination file, replaced atomically
+        """
+        snapshot = self.snapshot
+        index = snapshot.index
+        store_arrays, store_meta = index.store.to_arrays()
+        index_arrays, index_meta = index.to_arrays()
+        scorer = snapshot.scorer if isinstance(snapshot.scorer, VectorizedScorer) else None
+        sections = {
+            "store": store_arrays,
+            "index": index_arrays,
+            "scorer": scorer.arrays if scorer is not None else VectorizedScorer.build_arrays(index),
+        }
+        meta = {
+            "synonym_lookup": self.synonym_lookup,
+            "store": store_meta,
+            "index": index_meta,
+            "facets": snapshot.facets.to_dict(),
+        }
+        if snapshot.text_index is not None:
+            sections["text"], meta["text"] = snapshot.text_index.to_arrays()
+        if snapshot.neighbors is not None:
+            sections["neighbors"] = snapshot.neighbors.to_arrays()
+        
+        arrays = {
+            f"{section}/{name}": values
+            for section, section_arrays in sections.items()
+            for name, values in section_arrays.items()
+        }
+        write_catalog_snapshot(path, arrays, meta)
+    
+    def reload_careers(self) -> bool:
+        """
+        Reload the careers file and atomically swap in a newly compiled snapshot.
+        
+        The snapshot is built completely before it replaces the current one,
+        so requests already running keep using the snapshot they started
+        with. If the file is missing or invalid, the current snapshot stays.
+        
+        Returns:
+            True if a new snapshot was installed
+        """
+        with self._reload_lock:
+            source_path = self._resolve_careers_path(self.careers_file)
+            if source_path is None:
+                print(f"Error reloading careers data: Careers file not found: {self.careers_file}")
+                return False
+            
+            version = self.snapshot.version + 1
+            snapshot = None
+            try:
+                source_stamp = file_stamp(source_path)
+                if is_catalog_snapshot(source_path):
+                    snapshot = self._load_catalog_snapshot(source_path, source_stamp, version)
+                else:
+                    with open(source_path, 'r', encoding='utf-8') as file:
+                        careers_data = json.load(file)
+            except Exception as e:
+                print(f"Error reloading careers data: {e}")
+                return False
+            
+            if snapshot is None:
+                snapshot = self._build_snapshot(careers_data, source_path, source_stamp, version)
+            previous, self.snapshot = self.snapshot, snapshot
+            
+            # Free the old worker pool explicitly; sessions and cached
+            # objects may keep the old snapshot alive much longer
+            if isinstance(previous.scorer, ShardedScorer):
+                previous.scorer.retire()
+            self.result_cache.clear()
+            return True
+    
+    def start_auto_reload(self, interval: float = 5.0) -> None:
+        """Watch the careers file and reload it in a background thread when it changes."""
+        if self._watcher is None:
+            self._watcher = CatalogWatcher(
+                lambda: self._resolve_careers_path(self.careers_file), self.reload_careers, interval
+            )
+        self._watcher.start()
+    
+    def stop_auto_reload(self) -> None:
+        """Stop watching the careers file."""
+        if self._watcher is not None:
+            self._watcher.stop()
+    
     def _create_skill_synonyms(self) -> Dict[str, List[str]]:
         """Create a mapping of skill synonyms for better matching."""
         return {
@@ -95,12 +370,16 @@ class RecommendationEngine:
         """Normalize skill name for better matching."""
         skill_lower = skill.lower().strip()
         
-        # Check if skill is a synonym key
-        for main_skill, synonyms in self.skill_synonyms.items():
-            if skill_lower == main_skill or skill_lower in synonyms:
-                return main_skill
+        # Resolve synonyms through the precompiled reverse map
+        return self.synonym_lookup.get(skill_lower, skill_lower)
+    
+    def _correct_user_skill(self, index: CareerIndex, skill: str) -> Optional[str]:
+        """The closest spelling of a normalized user skill that names no known skill, or None."""
+        if index.skill_corrector is None or skill in index.skill_lookup or skill in self.synonym_lookup:
+            return None
         
-        return skill_lower
+        corrected = index.skill_corrector.correct(skill)
+        return self._normalize_skill(corrected) if corrected is not None else None
     
     def _calculate_skill_match_score(self, user_skills: List[str], career_skills: List[str]) -> Tuple[float, List[str], List[str]]:
         """Calculate match score between user skills and career requirements."""
@@ -135,6 +414,69 @@ class RecommendationEngine:
         
         return match_score, matched_skills, missing_skills
     
+    def _match_user_skills(self, index: CareerIndex, user_skills: List[str]) -> Tuple[set, Dict[int, int]]:
+        """
+        Resolve user skills against the compiled skill vocabulary.
+
+        A misspelled skill is matched both as typed and as its correction;
+        skills related to either count once for it.
+
+        Returns:
+            Tuple of (skill IDs the user has exactly, skill ID -> number of
+            user skills related to it)
+        """
+        exact_ids = set()
+        related_counts = {}
+        for skill in user_skills:
+            user_skill = self._normalize_skill(skill)
+            if user_skill in index.skill_lookup:
+                exact_ids.add(index.skill_lookup[user_skill])
+            related_ids = index.skill_matcher.related_ids(user_skill)
+
+            corrected = self._correct_user_skill(index, user_skill)
+            if corrected is not None:
+                if corrected in index.skill_lookup:
+                    exact_ids.add(index.skill_lookup[corrected])
+                related_ids = related_ids | index.skill_matcher.related_ids(corrected)
+
+            for skill_id in related_ids:
+                related_counts[skill_id] = related_counts.get(skill_id, 0) + 1
+
+        return exact_ids, related_counts
+
+    def _explain_skill_match(self, index: CareerIndex, skill_ids: Sequence[int], exact_ids: set,
+                             related_counts: Dict[int, int]) -> Tuple[float, List[str], List[str]]:
+        """Compiled equivalent of _calculate_skill_match_score for one career."""
+        if not skill_ids:
+            return 0.0, [], []
+
+        skill_names = index.skill_names
+        matched_skills = []
+        missing_skills = []
+
+        # Find exact matches
+        for skill_id in skill_ids:
+            if skill_id in exact_ids:
+                matched_skills.append(skill_names[skill_id])
+            else:
+                missing_skills.append(skill_names[skill_id])
+
+        # Partial matches: each related user skill clears one missing occurrence
+        seen = set(exact_ids)
+        for skill_id in skill_ids:
+            if skill_id not in seen and skill_id in related_counts:
+                seen.add(skill_id)
+                skill_name = skill_names[skill_id]
+                matched_skills.append(skill_name)
+                for _ in range(related_counts[skill_id]):
+                    if skill_name not in missing_skills:
+                        break
+                    missing_skills.remove(skill_name)
+
+        match_score = len(matched_skills) / len(skill_ids)
+
+        return match_score, matched_skills, missing_skills
+
     def _is_skill_related(self, skill1: str, skill2: str) -> bool:
         """Check if two skills are related using various methods."""
         # Check if one skill contains the other
@@ -142,8 +484,7 @@ class RecommendationEngine:
             return True
         
         # Check for common keywords
-        common_keywords = ["programming", "development", "analysis", "design", "management", "marketing"]
-        for keyword in common_keywords:
+        for keyword in COMMON_SKILL_KEYWORDS:
             if keyword in skill1 and keyword in skill2:
                 return True
         
@@ -169,23 +510,66 @@ class RecommendationEngine:
         
         return min(interest_matches / len(user_interests), 1.0)
     
+    def _create_interest_category_mapping(self) -> Dict[str, Tuple[str, ...]]:
+        """Create a mapping of (lowercase) career categories to related interest keywords."""
+        return {
+            "technology": ("programming", "computers", "software", "tech", "coding", "ai", "data"),
+            "design": ("art", "creativity", "visual", "graphics", "ui", "ux", "aesthetics"),
+            "marketing": ("advertising", "promotion", "social media", "branding", "communication"),
+            "business": ("management", "leadership", "strategy", "entrepreneurship", "finance"),
+            "finance": ("money", "investment", "banking", "accounting", "economics"),
+            "sales": ("selling", "negotiation", "customer service", "business development"),
+            "human resources": ("people", "hiring", "training", "workplace", "employee relations")
+        }
+    
     def _is_interest_related(self, interest: str, category: str) -> bool:
         """Check if interest is related to career category."""
-        interest_category_mapping = {
-            "technology": ["programming", "computers", "software", "tech", "coding", "ai", "data"],
-            "design": ["art", "creativity", "visual", "graphics", "ui", "ux", "aesthetics"],
-            "marketing": ["advertising", "promotion", "social media", "branding", "communication"],
-            "business": ["management", "leadership", "strategy", "entrepreneurship", "finance"],
-            "finance": ["money", "investment", "banking", "accounting", "economics"],
-            "sales": ["selling", "negotiation", "customer service", "business development"],
-            "human resources": ["people", "hiring", "training", "workplace", "employee relations"]
-        }
-        
-        if category in interest_category_mapping:
-            return any(keyword in interest for keyword in interest_category_mapping[category])
+        keywords = self.interest_category_mapping.get(category)
+        if keywords:
+            return any(keyword in interest for keyword in keywords)
         
         return False
     
+    def _calculate_category_scores(self, index: CareerIndex, user_interests: List[str],
+                                   preferred_categories: List[str]) -> Tuple[List[float], List[float]]:
+        """
+        Interest score and preference bonus of every category in the index.
+        
+        Interests are lowercased once and each distinct lowercase category is
+        scored once; careers then look their category's values up by code.
+        """
+        interests_lower = [interest.lower() for interest in user_interests]
+        preferred = set(preferred_categories or ())
+        scores_by_category: Dict[str, float] = {}
+        
+        interest_scores = []
+        category_bonuses = []
+        for category in index.categories:
+            category_lower = category.lower()
+            interest_score = scores_by_category.get(category_lower)
+            if interest_score is None:
+                interest_score = self._score_lowered_interests(interests_lower, category_lower)
+                scores_by_category[category_lower] = interest_score
+            interest_scores.append(interest_score)
+            category_bonuses.append(0.1 if category in preferred else 0.0)
+        
+        return interest_scores, category_bonuses
+    
+    def _score_lowered_interests(self, interests_lower: List[str], category_lower: str) -> float:
+        """_calculate_interest_match_score for interests and a category already lowercased."""
+        if not interests_lower:
+            return 0.5  # Neutral score if no interests provided
+        
+        keywords = self.interest_category_mapping.get(category_lower, ())
+        interest_matches = 0
+        for interest_lower in interests_lower:
+            if interest_lower == category_lower:
+                interest_matches += 1
+            elif any(keyword in interest_lower for keyword in keywords):
+                interest_matches += 0.7
+        
+        return min(interest_matches / len(interests_lower), 1.0)
+    
     def _calculate_experience_bonus(self, user_experience: str, career_experience: str) -> float:
         """Calculate bonus score based on experience level match."""
         if not user_experience or not career_experience:
@@ -199,12 +583,10 @@ class RecommendationEngine:
             return 0.2
         
         # Experience level hierarchy
-        exp_levels = {"entry": 1, "junior": 1, "mid": 2, "senior": 3, "lead": 4, "principal": 5}
-        
         user_level = 0
         career_level = 0
         
-        for level, value in exp_levels.items():
+        for level, value in EXPERIENCE_RANKS.items():
             if level in user_exp_lower:
                 user_level = value
             if level in career_exp_lower:
@@ -220,7 +602,74 @@ class RecommendationEngine:
         
         return 0.0
     
-    def get_recommendations(self, user_data: Dict[str, Any]) -> List[CareerMatch]:
+    def _calculate_experience_bonuses(self, index: CareerIndex, user_experience: str) -> List[float]:
+        """
+        _calculate_experience_bonus for every experience level in the index.
+        
+        Career levels were parsed into seniority ranks when the index was
+        built, so only the user's level is parsed here; past the substring
+        check the bonus is a rank comparison.
+        """
+        if not user_experience:
+            return [0.0] * len(index.experience_levels)
+        
+        user_lower = user_experience.lower()
+        user_rank = parse_experience_level(user_lower)
+        
+        bonuses = []
+        for career_lower, career_rank in zip(index.experience_lower, index.experience_ranks):
+            if not career_lower:
+                bonuses.append(0.0)
+            elif user_lower in career_lower or career_lower in user_lower:
+                bonuses.append(0.2)
+            elif user_rank and career_rank:
+                bonuses.append(0.15 if user_rank >= career_rank else -0.1)
+            else:
+                bonuses.append(0.0)
+        return bonuses
+    
+    def _prepare_scoring_inputs(self, index: CareerIndex, user_data: Dict[str, Any]) -> ScoringInputs:
+        """Resolve one user's assessment into per-skill, per-category and per-level scores."""
+        user_skills = user_data.get("skills", [])
+        user_interests = user_data.get("interests", [])
+        user_experience = user_data.get("experience_level", "")
+        preferred_categories = user_data.get("preferred_categories", [])
+        
+        exact_ids, related_counts = self._match_user_skills(index, user_skills)
+        
+        interest_scores, category_bonuses = self._calculate_category_scores(
+            index, user_interests, preferred_categories
+        )
+        
+        experience_bonuses = self._calculate_experience_bonuses(index, user_experience)
+        
+        return ScoringInputs(
+            exact_ids=exact_ids,
+            related_counts=related_counts,
+            interest_scores=interest_scores,
+            category_bonuses=category_bonuses,
+            experience_bonuses=experience_bonuses
+        )
+    
+    def _explain_top_careers(self, index: CareerIndex, inputs: ScoringInputs, top: Tuple[Any, Any],
+                             offset: int = 0) -> List[CareerMatch]:
+        """Build CareerMatch objects for ranks offset.. of a scorer's (positions, scores) top-k."""
+        positions, match_scores = top
+        return [
+            self._explain_career(index, inputs, int(position), float(match_score))
+            for position, match_score in zip(positions[offset:], match_scores[offset:])
+        ]
+    
+    def _explain_career(self, index: CareerIndex, inputs: ScoringInputs, position: int,
+                        match_score: float) -> CareerMatch:
+        """Second scoring phase: matched/missing skills for a selected career."""
+        _, matched_skills, missing_skills = self._explain_skill_match(
+            index, index.career_skills(position), inputs.exact_ids, inputs.related_counts
+        )
+        return self._build_career_match(index, position, match_score, matched_skills, missing_skills)
+    
+    def get_recommendations(self, user_data: Dict[str, Any], k: int = 3, offset: int = 0,
+                            mode: str = "skills") -> List[CareerMatch]:
         """
         Get career recommendations based on user data.
         
@@ -230,80 +679,369 @@ class RecommendationEngine:
                 - interests: List of user interests
                 - experience_level: User's experience level
                 - preferred_categories: List of preferred career categories (optional)
+            k: Number of recommendations to return
+            offset: Number of higher-ranked recommendations to skip (for paging)
+            mode: "skills" for the weighted skill/interest/experience score,
+                "text" for cosine similarity between the user's skills and
+                interests and each career's description and skills
         
         Returns:
-            List of CareerMatch objects sorted by match score (descending)
+            List of CareerMatch objects sorted by match score (descending).
+            Results may be served from the result cache and are shared
+            between callers, so they must not be modified.
         """
-        if not self.careers_data:
+        if mode not in self.SCORING_MODES:
+            raise ValueError(f"Unknown scoring mode: {mode}")
+        snapshot = self.snapshot
+        if mode == "text" and snapshot.text_index is None:
+            raise ValueError("Text similarity scoring is disabled")
+        if not len(snapshot.index) or k <= 0:
             return []
         
-        user_skills = user_data.get("skills", [])
-        user_interests = user_data.get("interests", [])
-        user_experience = user_data.get("experience_level", "")
-        preferred_categories = user_data.get("preferred_categories", [])
+        cache_key = self.recommendation_key(user_data, k, offset, mode, snapshot)
+        career_matches = self.result_cache.get(cache_key)
+        if career_matches is None:
+            if mode == "text":
+                terms = cache_key[2]
+                career_matches = self._compute_text_recommendations(snapshot, user_data, terms, k, offset)
+            else:
+                career_matches = self._compute_recommendations(snapshot, user_data, k, offset)
+            self.result_cache.put(cache_key, career_matches)
+        return list(career_matches)
+    
+    def recommendation_key(self, user_data: Dict[str, Any], k: int = 3, offset: int = 0, mode: str = "skills",
+                           snapshot: Optional[CatalogSnapshot] = None) -> Tuple:
+        """
+        Key shared by every get_recommendations call with the same result.
         
-        career_matches = []
+        It includes the catalog version, so keys change on reload. Used for
+        the result cache and for coalescing identical concurrent requests.
+        """
+        snapshot = snapshot or self.snapshot
+        if mode == "text" and snapshot.text_index is not None:
+            # Text mode ranks by query terms; skills still drive the explanations
+            terms = snapshot.text_index.query_terms(user_data.get("skills", []) + user_data.get("interests", []))
+            skills = tuple(sorted(self._normalize_skill(skill) for skill in user_data.get("skills", [])))
+            return (snapshot.version, mode, terms, skills, k, offset)
+        return (snapshot.version,) + self._canonical_assessment_key(user_data, k, offset)
+    
+    def _canonical_assessment_key(self, user_data: Dict[str, Any], k: int, offset: int) -> Tuple:
+        """
+        Cache key under which equivalent assessments collide.
         
-        for career in self.careers_data:
-            # Calculate skill match score
-            skill_score, matched_skills, missing_skills = self._calculate_skill_match_score(
-                user_skills, career.get("required_skills", [])
-            )
-            
-            # Calculate interest match score
-            interest_score = self._calculate_interest_match_score(
-                user_interests, career.get("category", "")
-            )
-            
-            # Calculate experience bonus
-            experience_bonus = self._calculate_experience_bonus(
-                user_experience, career.get("experience_level", "")
-            )
-            
-            # Category preference bonus
-            category_bonus = 0.0
-            if preferred_categories and career.get("category", "") in preferred_categories:
-                category_bonus = 0.1
-            
-            # Calculate final match score
-            # Weight: 60% skills, 30% interests, 10% experience + bonuses
-            final_score = (
-                skill_score * 0.6 +
-                interest_score * 0.3 +
-                experience_bonus +
-                category_bonus
-            )
-            
-            # Ensure score is between 0 and 1
-            final_score = max(0.0, min(1.0, final_score))
-            
-            # Create CareerMatch object
-            career_match = CareerMatch(
-                id=career.get("id", 0),
-                title=career.get("title", ""),
-                category=career.get("category", ""),
-                description=career.get("description", ""),
-                match_score=round(final_score, 3),
-                matched_skills=matched_skills,
-                missing_skills=missing_skills,
-                experience_level=career.get("experience_level", ""),
-                salary_range=career.get("salary_range", ""),
-                education=career.get("education", "")
-            )
+        Skills are normalized and interests lowercased the same way scoring
+        does, then sorted. Repeated skills and interests are kept because they
+        change the interest score and the missing skill list.
+        """
+        skills = tuple(sorted(self._normalize_skill(skill) for skill in user_data.get("skills", [])))
+        interests = tuple(sorted(interest.lower() for interest in user_data.get("interests", [])))
+        experience = user_data.get("experience_level", "").lower()
+        preferred = tuple(sorted(set(user_data.get("preferred_categories", []) or [])))
+        return skills, interests, experience, preferred, k, offset
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters of the result cache."""
+        return self.result_cache.stats()
+    
+    def _compute_recommendations(self, snapshot: CatalogSnapshot, user_data: Dict[str, Any], k: int,
+                                 offset: int) -> List[CareerMatch]:
+        """Score the catalog for one assessment, bypassing the result cache."""
+        index = snapshot.index
+        limit = offset + k
+        inputs = self._prepare_scoring_inputs(index, user_data)
+        
+        if snapshot.scorer is not None:
+            top = snapshot.scorer.top_k_batch([inputs], limit)[0]
+            return self._explain_top_careers(index, inputs, top, offset)
+        
+        # Visit units of careers in bound order (first position on ties) and
+        # stop once no remaining unit can displace the current k-th best, so
+        # careers of the skipped units are never touched. The heap keeps
+        # (score, -position) so its root is the weakest winner
+        blocks = index.skill_blocks
+        units, matched_blocks, unit_blocks = self._bounded_units(index, inputs)
+        partial_ids = inputs.related_counts.keys() - inputs.exact_ids
+        winners = []
+        for bound, first_position, group, unit in units:
+            if len(winners) == limit and (bound, -first_position) < winners[0]:
+                break
+            # A career hitting several matched skills is in several blocks
+            hits = set()
+            unit_matched = unit_blocks[unit] if unit >= 0 else matched_blocks[blocks.groups[matched_blocks] == group]
+            for block in unit_matched.tolist():
+                hits.update(blocks.positions[blocks.offsets[block]:blocks.offsets[block + 1]].tolist())
+            if unit >= 0:
+                candidates = [
+                    (self._score_career(index, inputs, partial_ids, position), position) for position in hits
+                ]
+            else:
+                # Only the first few careers without a hit can reach the top
+                group_score = self._final_score(index, inputs, first_position, 0.0)
+                candidates = []
+                for position in index.group_postings[group]:
+                    if len(candidates) == limit:
+                        break
+                    if position not in hits:
+                        candidates.append((group_score, position))
             
-            career_matches.append(career_match)
+            for score, position in candidates:
+                if len(winners) < limit:
+                    heapq.heappush(winners, (score, -position))
+                elif (score, -position) > winners[0]:
+                    heapq.heapreplace(winners, (score, -position))
+        winners.sort(reverse=True)
+        
+        # Second phase: explanations for the returned page only
+        return [
+            self._explain_career(index, inputs, -negative_position, score)
+            for score, negative_position in winners[offset:]
+        ]
+    
+    def _bounded_units(self, index: CareerIndex,
+                       inputs: ScoringInputs) -> Tuple[List[Tuple], np.ndarray, List[np.ndarray]]:
+        """
+        Partition the careers that can reach the top into units with a score upper bound.
+        
+        Careers hitting a matched skill form one unit per (group, number of
+        required skills), bounded by summing each matched skill's largest
+        share of the unit's skill lists (see SkillBlocks). Careers of a group
+        hitting no matched skill all score the group's base score and form
+        one unit per group. A group is a (category, experience level) pair.
         
-        # Sort by match score (descending) and return top 3
-        career_matches.sort(key=lambda x: x.match_score, reverse=True)
-        return career_matches[:3]
+        Returns:
+            Tuple of (units as (rounded bound, first position, group, unit
+            number or -1 for careers without a hit) sorted best first,
+            blocks of the matched skills, each unit's blocks)
+        """
+        blocks = index.skill_blocks
+        ranges = []
+        exact_flags = []
+        for skill_id in inputs.related_counts:
+            start, stop = int(blocks.indptr[skill_id]), int(blocks.indptr[skill_id + 1])
+            ranges.append(np.arange(start, stop))
+            exact_flags.append(np.full(stop - start, skill_id in inputs.exact_ids))
+        matched_blocks = np.concatenate(ranges) if ranges else np.empty(0, dtype=np.int64)
+        exact = np.concatenate(exact_flags) if exact_flags else np.empty(0, dtype=bool)
+        
+        block_totals = blocks.totals[matched_blocks]
+        shares = np.where(exact, blocks.max_occurrences[matched_blocks], 1) / block_totals
+        keys, unit_of_block = np.unique(
+            blocks.groups[matched_blocks].astype(np.int64) << 32 | block_totals, return_inverse=True
+        )
+        num_units = keys.size
+        unit_shares = np.bincount(unit_of_block, weights=shares, minlength=num_units)
+        unit_first = np.full(num_units, np.iinfo(np.int64).max)
+        np.minimum.at(unit_first, unit_of_block, blocks.positions[blocks.offsets[matched_blocks]])
+        by_unit = matched_blocks[np.argsort(unit_of_block, kind="stable")]
+        unit_blocks = np.split(by_unit, np.cumsum(np.bincount(unit_of_block, minlength=num_units))[:-1])
+        
+        base_groups = [group for group, postings in enumerate(index.group_postings) if postings]
+        groups = np.concatenate([keys >> 32, np.array(base_groups, dtype=np.int64)])
+        # Slack for float error between summed shares and matched / total
+        skill_bounds = np.concatenate([np.minimum(unit_shares + 1e-9, 1.0), np.zeros(len(base_groups))])
+        first_positions = np.concatenate([
+            unit_first, np.array([index.group_postings[group][0] for group in base_groups], dtype=np.int64)
+        ])
+        unit_numbers = np.concatenate([np.arange(num_units), np.full(len(base_groups), -1)])
+        
+        num_levels = max(len(index.experience_levels), 1)
+        categories = groups // num_levels
+        bounds = (
+            skill_bounds * 0.6 +
+            np.asarray(inputs.interest_scores, dtype=np.float64)[categories] * 0.3 +
+            np.asarray(inputs.experience_bonuses, dtype=np.float64)[groups % num_levels] +
+            np.asarray(inputs.category_bonuses, dtype=np.float64)[categories]
+        )
+        bounds = round_scores(np.clip(bounds, 0.0, 1.0))
+        order = np.lexsort((first_positions, -bounds))
+        units = list(zip(
+            bounds[order].tolist(), first_positions[order].tolist(),
+            groups[order].tolist(), unit_numbers[order].tolist()
+        ))
+        return units, matched_blocks, unit_blocks
+    
+    def _compute_text_recommendations(self, snapshot: CatalogSnapshot, user_data: Dict[str, Any],
+                                      terms: Tuple[str, ...], k: int, offset: int) -> List[CareerMatch]:
+        """Rank careers by TF-IDF cosine similarity; skill lists are explained as usual."""
+        index = snapshot.index
+        inputs = self._prepare_scoring_inputs(index, user_data)
+        top = snapshot.text_index.top_k(terms, offset + k)
+        return self._explain_top_careers(index, inputs, top, offset)
+    
+    def _score_career(self, index: CareerIndex, inputs: ScoringInputs, partial_ids: set,
+                      position: int) -> float:
+        """Rounded match score of one career, without building skill lists."""
+        skill_ids = index.skill_ids
+        start = index.skill_offsets[position]
+        end = index.skill_offsets[position + 1]
+        
+        # Exact matches count per occurrence, partial matches once per skill
+        matched = 0
+        partial_seen = None
+        for i in range(start, end):
+            skill_id = skill_ids[i]
+            if skill_id in inputs.exact_ids:
+                matched += 1
+            elif skill_id in partial_ids:
+                if partial_seen is None:
+                    partial_seen = {skill_id}
+                elif skill_id in partial_seen:
+                    continue
+                else:
+                    partial_seen.add(skill_id)
+                matched += 1
+        skill_score = matched / (end - start) if end > start else 0.0
+        
+        return self._final_score(index, inputs, position, skill_score)
+    
+    def _final_score(self, index: CareerIndex, inputs: ScoringInputs, position: int,
+                     skill_score: float) -> float:
+        """Rounded match score of a career given its skill score (monotonic in skill_score)."""
+        category_id = index.career_categories[position]
+        
+        # Calculate final match score
+        # Weight: 60% skills, 30% interests, 10% experience + bonuses
+        final_score = (
+            skill_score * 0.6 +
+            inputs.interest_scores[category_id] * 0.3 +
+            inputs.experience_bonuses[index.career_experience[position]] +
+            inputs.category_bonuses[category_id]
+        )
+        
+        # Ensure score is between 0 and 1
+        final_score = max(0.0, min(1.0, final_score))
+        
+        return round(final_score, 3)
+    
+    def _build_career_match(self, index: CareerIndex, position: int, match_score: float,
+                            matched_skills: List[str], missing_skills: List[str]) -> CareerMatch:
+        """Create a CareerMatch for the career at `position` in the index."""
+        store = index.store
+        return CareerMatch(
+            id=store.ids[position],
+            title=store.titles[position],
+            category=store.categories[position],
+            description=store.descriptions[position],
+            match_score=match_score,
+            matched_skills=matched_skills,
+            missing_skills=missing_skills,
+            experience_level=store.experience_levels[position],
+            salary_range=store.salary_ranges[position],
+            education=store.educations[position]
+        )
+    
+    def get_recommendations_batch(self, users_data: List[Dict[str, Any]], k: int = 3,
+                                  chunk_size: int = 32) -> List[List[CareerMatch]]:
+        """
+        Get career recommendations for many users in one pass.
+        
+        Users are scored together as a users x skills matrix against the
+        careers x skills matrix, `chunk_size` users at a time to bound memory.
+        
+        Args:
+            users_data: List of user data dictionaries, as for get_recommendations
+            k: Number of recommendations to return per user
+            chunk_size: Number of users scored per matrix product
+        
+        Returns:
+            One list of CareerMatch objects per user, in input order
+        """
+        snapshot = self.snapshot
+        index = snapshot.index
+        if not len(index):
+            return [[] for _ in users_data]
+        
+        scorer = self._get_vectorized_scorer(snapshot)
+        results = []
+        
+        for start in range(0, len(users_data), chunk_size):
+            chunk = [self._prepare_scoring_inputs(index, user_data) for user_data in users_data[start:start + chunk_size]]
+            for inputs, top in zip(chunk, scorer.top_k_batch(chunk, k)):
+                results.append(self._explain_top_careers(index, inputs, top))
+        
+        return results
+    
+    def _get_vectorized_scorer(self, snapshot: CatalogSnapshot,
+                               local: bool = False) -> Union[VectorizedScorer, ShardedScorer]:
+        """
+        Vectorized scorer for `snapshot`, built on first use with the python backend.
+        
+        With local=True an in-process VectorizedScorer is returned even when
+        the snapshot's own scorer is sharded.
+        """
+        if isinstance(snapshot.scorer, VectorizedScorer) or (snapshot.scorer is not None and not local):
+            return snapshot.scorer
+        batch_scorer = self._batch_scorer
+        if batch_scorer is None or batch_scorer[0] != snapshot.version:
+            batch_scorer = (snapshot.version, VectorizedScorer.from_index(snapshot.index))
+            self._batch_scorer = batch_scorer
+        return batch_scorer[1]
+    
+    def create_session(self, user_data: Dict[str, Any]) -> ScoringSession:
+        """
+        Start an incremental scoring session for live recommendations.
+        
+        The session keeps per-career scores so add_skill/remove_skill only
+        rescore careers requiring the affected skills; its recommendations()
+        match get_recommendations for the session's current assessment.
+        """
+        return ScoringSession(self, user_data)
+    
+    def get_learning_plan(self, user_data: Dict[str, Any], k: int = 3, max_skills: int = 3,
+                          num_suggestions: int = 10) -> Tuple[List[SkillUplift], List[SkillUplift]]:
+        """
+        Skills that would raise the user's top k recommendations the most.
+        
+        Args:
+            user_data: Assessment in get_recommendations form
+            k: Number of top careers to improve
+            max_skills: Maximum number of skills in the greedy plan
+            num_suggestions: Number of best single skills to return
+            
+        Returns:
+            Tuple of (best single skills to add, greedy multi-skill plan)
+        """
+        if not len(self.snapshot.index):
+            return [], []
+        return plan_learning(self.create_session(user_data), k, max_skills, num_suggestions)
     
     def get_career_by_id(self, career_id: int) -> Dict[str, Any]:
         """Get career details by ID."""
-        for career in self.careers_data:
-            if career.get("id") == career_id:
-                return career
-        return {}
+        store = self.snapshot.index.store
+        position = store.find(career_id)
+        if position is None:
+            return {}
+        return store.get(position)
+    
+    def get_similar_careers(self, career_id: int, limit: int = 10) -> Optional[List[Dict[str, Any]]]:
+        """
+        Careers most similar to a career, from the precomputed neighbor lists.
+        
+        Args:
+            career_id: ID of the career
+            limit: Maximum number of similar careers
+            
+        Returns:
+            Career dictionaries with a "similarity" score, best first, or
+            None if there is no career with that ID
+        """
+        snapshot = self.snapshot
+        if snapshot.neighbors is None:
+            raise ValueError("Similar careers are disabled")
+        
+        store = snapshot.index.store
+        position = store.find(career_id)
+        if position is None:
+            return None
+        return [
+            {**store.get(neighbor), "similarity": similarity}
+            for neighbor, similarity in snapshot.neighbors.similar(position, limit)
+        ]
     
     def get_all_careers(self) -> List[Dict[str, Any]]:
         """Get all careers data."""
-        return self.careers_data
+        return self.snapshot.index.store.to_list()
+    
+    def count_careers(self) -> int:
+        """Number of careers in the current catalog."""
+        return len(self.snapshot.index)
@@ -0,0 +1,145 @@
+"""
+Scoring Executor Module
+Runs CPU-bound scoring off the event loop with a bounded number of requests
+in flight, so a saturated worker sheds load instead of stalling.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class ExecutorSaturated(Exception):
+    """Raised when a ScoringExecutor already has max_pending requests in flight."""
+
+
+def _timed_call(fn: Callable, args: Tuple) -> Tuple[Any, float, float]:
+    """Run fn(*args) in a worker, returning it with monotonic start and end times."""
+    started = time.monotonic()
+    result = fn(*args)
+    return result, started, time.monotonic()
+
+
+def _ready() -> bool:
+    return True
+
+
+class ScoringExecutor:
+    """
+    Thread or process pool with admission control for scoring calls.
+
+    At most `max_pending` calls may be queued or running; further calls fail
+    immediately with ExecutorSaturated. Each call reports the time spent
+    waiting for a worker separately from the time spent computing. Calls
+    on objects that live in this process (such as a live scoring session)
+    run with local=True, which uses threads even for a process pool.
+    """
+
+    KINDS = ("thread", "process")
+
+    def __init__(self, kind: str = "thread", max_workers: Optional[int] = None, max_pending: int = 64,
+                 initializer: Optional[Callable[[], None]] = None):
+        """
+        Args:
+            kind: "thread" or "process" (spawned processes, which must be able
+                to import the scoring function's module)
+            max_workers: Pool size (executor default when None)
+            max_pending: Maximum calls queued or running at once
+            initializer: Called once in each worker process (process pools only)
+        """
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown scoring executor: {kind}")
+        self.kind = kind
+        self.max_pending = max_pending
+        if kind == "process":
+            self.max_workers = max_workers or os.cpu_count() or 1
+            self._executor: Executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=get_context("spawn"), initializer=initializer
+            )
+            self._local_executor: Executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="scoring-local"
+            )
+        else:
+            self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="scoring")
+            self._local_executor = self._executor
+
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.queue_seconds = 0.0
+        self.compute_seconds = 0.0
+
+    def warm_up(self) -> None:
+        """Start every worker now so the first requests do not wait for process startup."""
+        if self.kind == "process":
+            for future in [self._executor.submit(_ready) for _ in range(self.max_workers)]:
+                future.result()
+
+    async def run(self, fn: Callable, *args: Any, local: bool = False) -> Tuple[Any, float, float]:
+        """
+        Run fn(*args) in the pool, or in a thread of this process if `local`.
+
+        Returns:
+            (result, queue_seconds, compute_seconds)
+
+        Raises:
+            ExecutorSaturated: If max_pending calls are already in flight
+        """
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise ExecutorSaturated(f"{self.pending} scoring requests already in flight")
+            self.pending += 1
+
+        submitted = time.monotonic()
+        try:
+            loop = asyncio.get_running_loop()
+            executor = self._local_executor if local else self._executor
+            result, started, finished = await loop.run_in_executor(executor, _timed_call, fn, args)
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            raise
+        finally:
+            with self._lock:
+                self.pending -= 1
+
+        queue_seconds = max(0.0, started - submitted)
+        compute_seconds = finished - started
+        with self._lock:
+            self.completed += 1
+            self.queue_seconds += queue_seconds
+            self.compute_seconds += compute_seconds
+        return result, queue_seconds, compute_seconds
+
+    def stats(self) -> Dict[str, Any]:
+        """Load and timing counters."""
+        with self._lock:
+            return {
+                "executor": self.kind,
+                "in_flight": self.pending,
+                "max_pending": self.max_pending,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "avg_queue_ms": round(self.queue_seconds / self.completed * 1000, 3) if self.completed else 0.0,
+                "avg_compute_ms": round(self.compute_seconds / self.completed * 1000, 3) if self.completed else 0.0,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the pool once running calls finish."""
+        self._executor.shutdown(wait=True)
+        if self._local_executor is not self._executor:
+            self._local_executor.shutdown(wait=True)
+
+
+def server_timing(queue_seconds: float, compute_seconds: float) -> str:
+    """Server-Timing header value separating queue wait from compute time."""
+    return f"queue;dur={queue_seconds * 1000:.3f}, compute;dur={compute_seconds * 1000:.3f}"
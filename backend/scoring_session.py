@@ -0,0 +1,224 @@
+"""
+Scoring Session Module
+Keeps one user's per-career scores between requests so adding or removing a
+skill only rescores the careers that require the affected skills.
+"""
+
+from collections import Counter
+from typing import List, Dict, Any, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from career_index import ScoringInputs
+from vectorized_scoring import VectorizedScorer, top_positions
+
+if TYPE_CHECKING:
+    from recommendation_engine import RecommendationEngine, CareerMatch, CatalogSnapshot
+
+
+class ScoringSession:
+    """
+    Incrementally maintained scores of every career for one assessment.
+
+    A career's matched skill count is a sum over its distinct skills: an
+    exactly matched skill counts once per occurrence, a partially matched
+    one counts once. A skill delta therefore only changes the careers in the
+    posting lists of skills whose match state (none/partial/exact) changed.
+    Interest, experience and preference changes affect every career and
+    trigger a full (vectorized) recompute.
+    """
+
+    def __init__(self, engine: "RecommendationEngine", user_data: Dict[str, Any]):
+        self.engine = engine
+        self.skills: Counter = Counter(user_data.get("skills", []))
+        self.interests: List[str] = list(user_data.get("interests", []))
+        self.experience_level: str = user_data.get("experience_level", "")
+        self.preferred_categories: List[str] = list(user_data.get("preferred_categories", []) or [])
+        self._rebuild()
+
+    def user_data(self) -> Dict[str, Any]:
+        """The session's current assessment, in get_recommendations form."""
+        return {
+            "skills": list(self.skills.elements()),
+            "interests": self.interests,
+            "experience_level": self.experience_level,
+            "preferred_categories": self.preferred_categories
+        }
+
+    def _rebuild(self) -> None:
+        """Score every career from scratch against the engine's current snapshot."""
+        self.snapshot: "CatalogSnapshot" = self.engine.snapshot
+        self.scorer: VectorizedScorer = self.engine._get_vectorized_scorer(self.snapshot, local=True)
+        self.inputs: ScoringInputs = self.engine._prepare_scoring_inputs(self.snapshot.index, self.user_data())
+
+        skill_major = self.scorer.skill_counts
+        matched = (
+            skill_major[self._ids(self.inputs.exact_ids)].sum(axis=0) +
+            self.scorer.skill_presence[self._ids(self._partial_ids())].sum(axis=0)
+        )
+        self.matched = np.asarray(matched, dtype=np.float64).ravel()
+        self.scores = self.scorer.score(self.inputs)
+
+    @staticmethod
+    def _ids(skill_ids) -> np.ndarray:
+        return np.fromiter(skill_ids, dtype=np.int64, count=len(skill_ids))
+
+    def _partial_ids(self) -> set:
+        return self.inputs.related_counts.keys() - self.inputs.exact_ids
+
+    @staticmethod
+    def _skill_state(exact_ids: set, related_counts: Dict[int, int]) -> Dict[int, int]:
+        """Match state per skill ID: 2 exact, 1 partial (absent means unmatched)."""
+        state = dict.fromkeys(related_counts, 1)
+        state.update(dict.fromkeys(exact_ids, 2))
+        return state
+
+    def _matched_delta(self, before: Dict[int, int], after: Dict[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Careers whose matched count changes between two skill states.
+
+        Returns:
+            (sorted unique career positions, change of their matched counts)
+        """
+        careers_touched = []
+        deltas = []
+        indptr = self.scorer.skill_counts.indptr
+        careers = self.scorer.skill_counts.indices
+        counts = self.scorer.skill_counts.data
+        for skill_id in before.keys() | after.keys():
+            old_state, new_state = before.get(skill_id, 0), after.get(skill_id, 0)
+            if old_state == new_state:
+                continue
+            start, stop = indptr[skill_id], indptr[skill_id + 1]
+            occurrences = counts[start:stop]
+            contribution = {0: 0.0, 1: 1.0, 2: occurrences}
+            careers_touched.append(careers[start:stop])
+            deltas.append(np.broadcast_to(contribution[new_state] - contribution[old_state], stop - start))
+
+        if not careers_touched:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        positions, inverse = np.unique(np.concatenate(careers_touched), return_inverse=True)
+        return positions, np.bincount(inverse, weights=np.concatenate(deltas), minlength=positions.size)
+
+    def _apply_skills(self, skills: Counter) -> None:
+        """Switch to a new skill multiset, rescoring only careers whose matches changed."""
+        if self.engine.snapshot is not self.snapshot:
+            self.skills = skills
+            self._rebuild()
+            return
+
+        before = self._skill_state(self.inputs.exact_ids, self.inputs.related_counts)
+        self.skills = skills
+        self.inputs.exact_ids, self.inputs.related_counts = self.engine._match_user_skills(
+            self.snapshot.index, list(skills.elements())
+        )
+        after = self._skill_state(self.inputs.exact_ids, self.inputs.related_counts)
+
+        positions, deltas = self._matched_delta(before, after)
+        if positions.size:
+            self.matched[positions] += deltas
+            self.scores[positions] = self._final_scores(positions, self.matched[positions])
+
+    def _final_scores(self, positions: np.ndarray, matched: np.ndarray) -> np.ndarray:
+        """Final scores of `positions` given their matched skill counts."""
+        scorer = self.scorer
+        interest = np.asarray(self.inputs.interest_scores, dtype=np.float64)
+        bonus = np.asarray(self.inputs.category_bonuses, dtype=np.float64)
+        experience = np.asarray(self.inputs.experience_bonuses, dtype=np.float64)
+        categories = scorer.career_categories[positions]
+
+        skill_score = matched / scorer.skill_totals[positions]
+        scores = (
+            skill_score * 0.6 +
+            interest[categories] * 0.3 +
+            experience[scorer.career_experience[positions]] +
+            bonus[categories]
+        )
+        np.clip(scores, 0.0, 1.0, out=scores)
+        return scores
+
+    def skill_gains(self, skill_ids: np.ndarray, top: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Effect of matching each catalog skill in `skill_ids` exactly, without changing the session.
+
+        Only the careers requiring each skill are rescored, all skills in one
+        pass over their concatenated posting lists. A better match never
+        lowers a score, so a skill's new top careers are among the current
+        ones and the careers requiring it.
+
+        Args:
+            skill_ids: Skills the user might learn, none of them matched exactly
+            top: Positions of the current top careers
+
+        Returns:
+            Per skill, the increase of the summed scores of the top len(top)
+            careers and the number of careers whose score would rise
+        """
+        num_skills = skill_ids.size
+        skill_major = self.scorer.skill_counts
+        starts = skill_major.indptr[skill_ids].astype(np.int64)
+        lengths = skill_major.indptr[skill_ids + 1] - starts
+        labels = np.repeat(np.arange(num_skills), lengths)
+        entries = np.arange(labels.size) + np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        positions = skill_major.indices[entries]
+
+        # An exact match counts every occurrence, replacing a partial match's one
+        partial = np.isin(skill_ids, self._ids(self.inputs.related_counts.keys())).astype(np.float64)
+        new_scores = self._final_scores(positions, self.matched[positions] + skill_major.data[entries] - partial[labels])
+        improved = np.bincount(labels, weights=new_scores > self.scores[positions], minlength=num_skills)
+
+        # Pool each skill's rescored careers with the current top careers it
+        # does not touch, then sum the best len(top) of every pool. Careers
+        # outside the top that cannot beat its lowest score never count.
+        slots = np.full(self.scores.size, -1, dtype=np.int64)
+        slots[top] = np.arange(top.size)
+        touched_top = np.zeros((num_skills, top.size), dtype=bool)
+        in_top = slots[positions] >= 0
+        touched_top[labels[in_top], slots[positions[in_top]]] = True
+        kept_labels, kept_slots = np.nonzero(~touched_top)
+        contenders = in_top | (new_scores > self.scores[top].min()) if top.size else in_top
+        pool_labels = np.concatenate([labels[contenders], kept_labels])
+        pool_scores = np.concatenate([new_scores[contenders], self.scores[top][kept_slots]])
+
+        order = np.lexsort((-pool_scores, pool_labels))
+        pool_labels, pool_scores = pool_labels[order], pool_scores[order]
+        ranks = np.arange(pool_labels.size) - np.searchsorted(pool_labels, pool_labels, side="left")
+        best = ranks < top.size
+        new_sums = np.bincount(pool_labels[best], weights=pool_scores[best], minlength=num_skills)
+        return new_sums - self.scores[top].sum(), improved.astype(np.int64)
+
+    def add_skill(self, skill: str) -> None:
+        """Add one skill (repeats are kept, as in an assessment)."""
+        skills = self.skills.copy()
+        skills[skill] += 1
+        self._apply_skills(skills)
+
+    def remove_skill(self, skill: str) -> None:
+        """Remove one occurrence of a skill; unknown skills are ignored."""
+        if not self.skills[skill]:
+            return
+        skills = self.skills.copy()
+        skills[skill] -= 1
+        if not skills[skill]:
+            del skills[skill]
+        self._apply_skills(skills)
+
+    def update_profile(self, interests: List[str] = None, experience_level: str = None,
+                       preferred_categories: List[str] = None) -> None:
+        """Replace interests, experience level and/or preferred categories (full rescore)."""
+        if interests is not None:
+            self.interests = list(interests)
+        if experience_level is not None:
+            self.experience_level = experience_level
+        if preferred_categories is not None:
+            self.preferred_categories = list(preferred_categories)
+        self._rebuild()
+
+    def recommendations(self, k: int = 3, offset: int = 0) -> List["CareerMatch"]:
+        """Current top careers, identical to get_recommendations for the same assessment."""
+        if self.engine.snapshot is not self.snapshot:
+            self._rebuild()
+        if k <= 0 or not len(self.snapshot.index):
+            return []
+        top: Tuple[np.ndarray, np.ndarray] = top_positions(self.scores, offset + k)
+        return self.engine._explain_top_careers(self.snapshot.index, self.inputs, top, offset)
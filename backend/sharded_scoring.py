@@ -0,0 +1,156 @@
+"""
+Sharded Scoring Module
+Splits the compiled catalog across a process pool. Each worker maps the shard
+arrays from shared memory once, scores its careers and returns a local top-k
+that the parent merges.
+"""
+
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Dict, Optional, Tuple
+
+import numpy as np
+
+from career_index import CareerIndex, ScoringInputs
+from vectorized_scoring import VectorizedScorer
+
+# (shared memory block name, shape, dtype string)
+ArraySpec = Tuple[str, Tuple[int, ...], str]
+
+# Seconds a retired scorer stays open for requests that picked up its
+# snapshot just before a reload but have not submitted work yet
+RETIRE_GRACE_SECONDS = 10.0
+
+# Per worker process state, filled in by _init_worker
+_worker_shards: List[Tuple[int, VectorizedScorer]] = []
+_worker_blocks: List[SharedMemory] = []
+
+
+def _init_worker(shard_specs: List[Tuple[int, Dict[str, ArraySpec]]], num_skills: int) -> None:
+    """Attach to every shard's shared memory and build its scorer without copying."""
+    for start, specs in shard_specs:
+        arrays = {}
+        for name, (block_name, shape, dtype) in specs.items():
+            block = SharedMemory(name=block_name)
+            _worker_blocks.append(block)
+            arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+        _worker_shards.append((start, VectorizedScorer(arrays, num_skills)))
+
+
+def _score_shard(shard: int, inputs_list: List[ScoringInputs], limit: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """Local top-k of one shard for each user, with catalog-wide positions."""
+    start, scorer = _worker_shards[shard]
+    return [(positions + start, scores) for positions, scores in scorer.top_k_batch(inputs_list, limit)]
+
+
+def _ready(_: int) -> bool:
+    return True
+
+
+def _release(executor: ProcessPoolExecutor, blocks: List[SharedMemory]) -> None:
+    # Never waits for the workers, since a finalizer may run in a request
+    # thread; they are idle when this runs and exit on their own
+    executor.shutdown(wait=False)
+    for block in blocks:
+        block.close()
+        block.unlink()
+
+
+class ShardedScorer:
+    """
+    Vectorized scoring spread over worker processes, one catalog shard per task.
+
+    The per-shard arrays are copied into shared memory when the scorer is
+    built; requests only ship the ScoringInputs of the users being scored.
+    When a reload replaces the catalog, retire() frees the pool and shared
+    memory in a background thread once calls in flight have finished,
+    regardless of sessions or other objects still referencing the scorer.
+    """
+
+    def __init__(self, index: CareerIndex, num_shards: Optional[int] = None, max_workers: Optional[int] = None):
+        """
+        Args:
+            index: Compiled catalog to shard
+            num_shards: Number of contiguous career ranges (defaults to the CPU count)
+            max_workers: Worker processes (defaults to num_shards)
+        """
+        self.num_shards = max(1, num_shards or os.cpu_count() or 1)
+        self.max_workers = max_workers or self.num_shards
+        self._blocks: List[SharedMemory] = []
+        self._active = 0
+        self._idle = threading.Condition()
+
+        bounds = np.linspace(0, len(index), self.num_shards + 1).astype(int)
+        shard_specs = []
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            arrays = VectorizedScorer.build_arrays(index, int(start), int(stop))
+            shard_specs.append((int(start), {name: self._share(array) for name, array in arrays.items()}))
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(shard_specs, len(index.skill_names)),
+        )
+        self._finalizer = weakref.finalize(self, _release, self._executor, self._blocks)
+
+        # Start every worker now so no request waits for a process to spawn
+        list(self._executor.map(_ready, range(self.max_workers)))
+
+    def _share(self, array: np.ndarray) -> ArraySpec:
+        """Copy `array` into a new shared memory block."""
+        block = SharedMemory(create=True, size=max(array.nbytes, 1))
+        self._blocks.append(block)
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+        return block.name, array.shape, array.dtype.str
+
+    def top_k_batch(self, inputs_list: List[ScoringInputs], limit: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Positions and rounded scores of the best `limit` careers for each user.
+
+        Every shard returns its own best `limit`; shards cover contiguous
+        ranges, so sorting the union by (-score, position) reproduces the
+        single-process ranking.
+        """
+        with self._idle:
+            self._active += 1
+        try:
+            futures = [
+                self._executor.submit(_score_shard, shard, inputs_list, limit)
+                for shard in range(self.num_shards)
+            ]
+            shard_results = [future.result() for future in futures]
+        finally:
+            with self._idle:
+                self._active -= 1
+                self._idle.notify_all()
+
+        results = []
+        for user in range(len(inputs_list)):
+            positions = np.concatenate([shard[user][0] for shard in shard_results])
+            scores = np.concatenate([shard[user][1] for shard in shard_results])
+            order = np.lexsort((positions, -scores))[:limit]
+            results.append((positions[order], scores[order]))
+        return results
+
+    def close(self) -> None:
+        """Stop the worker processes and free the shared memory."""
+        self._finalizer()
+
+    def retire(self, grace: float = RETIRE_GRACE_SECONDS) -> None:
+        """
+        Close the scorer from a background thread after `grace` seconds, as
+        soon as no call is in flight. Returns immediately.
+        """
+        threading.Thread(target=self._close_when_idle, args=(grace,), daemon=True).start()
+
+    def _close_when_idle(self, grace: float) -> None:
+        time.sleep(grace)
+        with self._idle:
+            self._idle.wait_for(lambda: self._active == 0)
+            self.close()
@@ -0,0 +1,49 @@
+"""
+Single Flight Module
+Coalesces concurrent identical async calls so only one of them does the work.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class SingleFlight:
+    """
+    Run at most one call per key at a time; callers arriving while it runs
+    await the same result (or exception) instead of starting their own.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Await call() for `key`, or join the call already running for it.
+
+        Returns:
+            (result, shared) where shared is True if another caller's
+            computation was reused
+        """
+        future = self._calls.get(key)
+        shared = future is not None
+        if shared:
+            self.coalesced += 1
+        else:
+            self.leaders += 1
+            future = asyncio.ensure_future(call())
+            self._calls[key] = future
+            future.add_done_callback(lambda _: self._calls.pop(key, None))
+
+        # A waiter going away (e.g. client disconnect) must not cancel the
+        # computation the other waiters are sharing
+        return await asyncio.shield(future), shared
+
+    def stats(self) -> Dict[str, int]:
+        """Counters of calls that ran versus calls that joined one."""
+        return {
+            "in_flight_keys": len(self._calls),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+        }
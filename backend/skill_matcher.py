@@ -0,0 +1,275 @@
+"""
+Skill Matcher Module
+Compiled lookups for skill synonym resolution and skill relatedness.
+"""
+
+from bisect import bisect_right
+from collections import Counter, deque
+from functools import lru_cache
+from typing import List, Dict, FrozenSet, Iterable, Optional, Tuple
+
+# Keywords that make two skills related when both contain them
+COMMON_SKILL_KEYWORDS = ["programming", "development", "analysis", "design", "management", "marketing"]
+
+_SEPARATOR = "\x00"
+
+# Padding around a string so its first and last characters get their own bigrams
+_PAD_START, _PAD_END = "\x02", "\x03"
+
+
+def build_synonym_lookup(skill_synonyms: Dict[str, List[str]]) -> Dict[str, str]:
+    """
+    Build a reverse map from every skill name and synonym to its canonical skill.
+
+    The first entry in `skill_synonyms` that mentions a name wins, which is the
+    same precedence as scanning the synonyms dict in order.
+    """
+    lookup: Dict[str, str] = {}
+    for main_skill, synonyms in skill_synonyms.items():
+        lookup.setdefault(main_skill, main_skill)
+        for synonym in synonyms:
+            lookup.setdefault(synonym, main_skill)
+    return lookup
+
+
+class SkillMatcher:
+    """
+    Answers "which vocabulary skills are related to this skill" by lookup.
+
+    Two skills are related when one contains the other or both contain one of
+    COMMON_SKILL_KEYWORDS. Containment of vocabulary names in a query is found
+    with an Aho-Corasick automaton, containment of the query in vocabulary names
+    with a single scan over the joined vocabulary, and results are memoized per
+    query string.
+    """
+
+    def __init__(self, skill_names: List[str], keywords: List[str] = COMMON_SKILL_KEYWORDS,
+                 cache_size: int = 4096):
+        self.skill_names = skill_names
+        self.keywords = keywords
+        self._empty_ids = frozenset(i for i, name in enumerate(skill_names) if not name)
+        self._keyword_ids = {
+            keyword: frozenset(i for i, name in enumerate(skill_names) if keyword in name)
+            for keyword in keywords
+        }
+        self._build_automaton()
+        self._build_joined_text()
+        self.related_ids = lru_cache(maxsize=cache_size)(self._related_ids)
+
+    def _build_automaton(self) -> None:
+        """Build Aho-Corasick goto/fail/output tables over the vocabulary."""
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+
+        for skill_id, name in enumerate(self.skill_names):
+            if not name:
+                continue
+            state = 0
+            for char in name:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(skill_id)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                outputs[next_state] = outputs[next_state] + outputs[fail[next_state]]
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+
+    def _build_joined_text(self) -> None:
+        """Join the vocabulary into one string with the start offset of each name."""
+        offsets = []
+        position = 0
+        for name in self.skill_names:
+            offsets.append(position)
+            position += len(name) + 1
+        self._joined = _SEPARATOR.join(self.skill_names)
+        self._offsets = offsets
+
+    def _names_in(self, text: str) -> List[int]:
+        """IDs of vocabulary names occurring in `text`."""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        found = []
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                found.extend(outputs[state])
+        return found
+
+    def _names_containing(self, text: str) -> List[int]:
+        """IDs of vocabulary names that contain `text`."""
+        if _SEPARATOR in text:
+            return [i for i, name in enumerate(self.skill_names) if text in name]
+
+        found = []
+        offsets = self._offsets
+        joined = self._joined
+        start = joined.find(text)
+        while start != -1:
+            skill_id = bisect_right(offsets, start) - 1
+            found.append(skill_id)
+            # Skip to the next name so each one is reported once
+            next_start = offsets[skill_id + 1] if skill_id + 1 < len(offsets) else len(joined)
+            start = joined.find(text, next_start)
+        return found
+
+    def _related_ids(self, skill: str) -> FrozenSet[int]:
+        if not skill:
+            return frozenset(range(len(self.skill_names)))
+
+        related = set(self._empty_ids)
+        related.update(self._names_in(skill))
+        related.update(self._names_containing(skill))
+        for keyword in self.keywords:
+            if keyword in skill:
+                related.update(self._keyword_ids[keyword])
+        return frozenset(related)
+
+
+def max_typos(length: int) -> int:
+    """
+    Edits tolerated in a skill of `length` characters: none below 5 (mostly
+    acronyms, where one edit names another skill, e.g. "sem" -> "seo"), one
+    up to 8, two beyond.
+    """
+    if length < 5:
+        return 0
+    return 1 if length < 9 else 2
+
+
+def _bigrams(text: str) -> Counter:
+    padded = _PAD_START + text + _PAD_END
+    return Counter(padded[i:i + 2] for i in range(len(padded) - 1))
+
+
+def edit_distance(a: str, b: str, bound: int) -> int:
+    """
+    Optimal string alignment distance between `a` and `b`, capped at bound + 1.
+
+    Insertions, deletions, substitutions and transpositions of adjacent
+    characters each count as one edit. Stops as soon as every alignment
+    needs more than `bound` edits.
+    """
+    if abs(len(a) - len(b)) > bound:
+        return bound + 1
+
+    previous = None
+    row = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(row[j] + 1, current[j - 1] + 1, row[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous[j - 2] + 1)
+        if min(current) > bound:
+            return bound + 1
+        previous, row = row, current
+    return min(row[-1], bound + 1)
+
+
+class SkillCorrector:
+    """
+    Resolves misspelled skills ("pyhton", "javascrpit") to the closest known name.
+
+    Only names starting with the same character are considered, and a
+    correction is returned only when it is strictly closer than every name
+    standing for a different skill, so "hosting" is not turned into "testing".
+
+    Candidates come from an inverted index of padded character bigrams. Each
+    edit changes at most three of a string's bigrams, so a term within k
+    edits of the query shares at least max(len) + 1 - 3k bigrams with it,
+    and at least one of any 3k + 1 of the query's bigrams. Only terms in the
+    postings of the query's 3k + 1 rarest bigrams that also pass the length
+    and count filters get a full edit distance computation. Results are
+    memoized per query string.
+    """
+
+    def __init__(self, terms: Iterable[str], canonical: Optional[Dict[str, str]] = None,
+                 cache_size: int = 4096):
+        """
+        Args:
+            terms: Known skill names in order of preference; on equal distance
+                between names of the same skill the earlier term wins
+            canonical: Skill each term stands for (e.g. synonym -> main skill);
+                terms missing from it stand for themselves
+            cache_size: Maximum number of memoized queries
+        """
+        self.terms = list(dict.fromkeys(term for term in terms if term))
+        canonical = canonical or {}
+        self._skills = [canonical.get(term, term) for term in self.terms]
+        self._term_grams = [_bigrams(term) for term in self.terms]
+        self._postings: Dict[str, List[int]] = {}
+        for term_id, grams in enumerate(self._term_grams):
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(term_id)
+        self.correct = lru_cache(maxsize=cache_size)(self._correct)
+
+    def _candidates(self, text: str, budget: int) -> List[int]:
+        """Terms that may be within `budget` edits of `text`, by bigram filters."""
+        grams = _bigrams(text)
+        rarest = sorted(grams.items(), key=lambda item: len(self._postings.get(item[0], ())))
+        candidates = set()
+        needed = 3 * budget + 1
+        for gram, count in rarest:
+            candidates.update(self._postings.get(gram, ()))
+            needed -= count
+            if needed <= 0:
+                break
+
+        found = []
+        for term_id in candidates:
+            if self.terms[term_id][0] != text[0]:
+                continue
+            term_length = len(self.terms[term_id])
+            if abs(term_length - len(text)) > budget:
+                continue
+            term_grams = self._term_grams[term_id]
+            common = sum(min(count, term_grams.get(gram, 0)) for gram, count in grams.items())
+            if common >= max(term_length, len(text)) + 1 - 3 * budget:
+                found.append(term_id)
+        return found
+
+    def _correct(self, text: str) -> Optional[str]:
+        """
+        The closest term within max_typos(len(text)) edits, or None when no
+        term is that close or a term of another skill is as close.
+        """
+        budget = max_typos(len(text))
+        if not budget:
+            return None
+
+        matches: List[Tuple[int, int]] = []
+        for term_id in self._candidates(text, budget):
+            distance = edit_distance(text, self.terms[term_id], budget)
+            if distance <= budget:
+                matches.append((distance, term_id))
+        if not matches:
+            return None
+
+        matches.sort()
+        best_distance, best_id = matches[0]
+        for distance, term_id in matches[1:]:
+            if distance > best_distance:
+                break
+            if self._skills[term_id] != self._skills[best_id]:
+                return None
+        return self.terms[best_id]
@@ -0,0 +1,118 @@
+"""
+Skill Suggester Module
+Prefix completion of skill names for autocomplete, over a sorted array of
+lowercase keys built once per catalog load.
+"""
+
+import heapq
+from bisect import bisect_left
+from functools import lru_cache
+from typing import List, Dict, Callable, Tuple
+
+# Upper bound on suggestions per query
+MAX_SUGGESTIONS = 50
+
+# Prefixes up to this length match the largest key ranges, so their
+# suggestions are ranked at build time
+PRECOMPUTED_PREFIX_LENGTH = 2
+
+
+class SkillSuggester:
+    """
+    Completes a typed prefix to catalog skills, most widely required first.
+
+    Every skill is reachable by a prefix of its name or of any later word in
+    it ("learn" completes to "Machine Learning"), and by a prefix of any
+    synonym that normalizes to the same skill ("js" completes to
+    "JavaScript"). Skills matched by name rank before skills matched only
+    through a synonym. Synonym groups with no catalog skill suggest their
+    canonical name with a count of zero. The keys are one sorted list, so a
+    prefix is a bisect plus a scan of its matching range. Answers for short
+    prefixes, whose ranges are the largest, are ranked at build time and the
+    others are memoized per (prefix, limit).
+    """
+
+    def __init__(self, skill_counts: Dict[str, int], synonym_lookup: Dict[str, str],
+                 normalize_skill: Callable[[str], str], cache_size: int = 4096):
+        """
+        Args:
+            skill_counts: Careers requiring each catalog skill (as in FacetIndex)
+            synonym_lookup: Lowercase skill name or synonym -> canonical skill
+            normalize_skill: Function mapping a raw skill name to its canonical form
+            cache_size: Maximum number of memoized queries
+        """
+        self.skills: List[str] = []
+        self.counts: List[int] = []
+        by_canonical: Dict[str, List[int]] = {}
+        for skill, count in skill_counts.items():
+            if not isinstance(skill, str) or not skill.strip():
+                continue
+            skill_id = len(self.skills)
+            self.skills.append(skill)
+            self.counts.append(count)
+            by_canonical.setdefault(normalize_skill(skill), []).append(skill_id)
+
+        # (key, 0 for a name match or 1 for a synonym match, skill ID)
+        keys: List[Tuple[str, int, int]] = []
+        for skill_id, skill in enumerate(self.skills):
+            keys.extend((key, 0, skill_id) for key in self._word_keys(" ".join(skill.lower().split())))
+        for synonym, canonical in synonym_lookup.items():
+            skill_ids = by_canonical.get(canonical)
+            if skill_ids is None:
+                skill_ids = [len(self.skills)]
+                by_canonical[canonical] = skill_ids
+                self.skills.append(canonical)
+                self.counts.append(0)
+            for key in self._word_keys(synonym):
+                keys.extend((key, 1, skill_id) for skill_id in skill_ids)
+
+        keys = sorted(set(keys))
+        self._keys = [key for key, _, _ in keys]
+        self._via_synonym = [via_synonym for _, via_synonym, _ in keys]
+        self._skill_ids = [skill_id for _, _, skill_id in keys]
+        self._precomputed = {
+            prefix: self._ranked(prefix, MAX_SUGGESTIONS)
+            for prefix in {key[:length] for key in self._keys for length in range(1, PRECOMPUTED_PREFIX_LENGTH + 1)}
+        }
+        self.suggest = lru_cache(maxsize=cache_size)(self._suggest)
+
+    @staticmethod
+    def _word_keys(name: str) -> List[str]:
+        """The name from the start of each of its words."""
+        return [name[i:] for i in range(len(name)) if name[i] != " " and (i == 0 or name[i - 1] == " ")]
+
+    def _suggest(self, prefix: str, limit: int = 10) -> Tuple[Tuple[str, int], ...]:
+        """
+        Skills completing `prefix`: name matches before synonym matches, then
+        by careers requiring them, then by name.
+
+        Args:
+            prefix: Typed text (case-insensitive)
+            limit: Maximum number of suggestions (capped at MAX_SUGGESTIONS)
+
+        Returns:
+            Tuple of (skill, careers) pairs
+        """
+        prefix = " ".join(prefix.lower().split())
+        limit = min(limit, MAX_SUGGESTIONS)
+        if not prefix or limit <= 0:
+            return ()
+        if len(prefix) <= PRECOMPUTED_PREFIX_LENGTH:
+            return self._precomputed.get(prefix, ())[:limit]
+        return self._ranked(prefix, limit)
+
+    def _ranked(self, prefix: str, limit: int) -> Tuple[Tuple[str, int], ...]:
+        """Scan the keys starting with `prefix` and rank their skills."""
+        keys = self._keys
+        matched: Dict[int, int] = {}
+        for i in range(bisect_left(keys, prefix), len(keys)):
+            if not keys[i].startswith(prefix):
+                break
+            skill_id = self._skill_ids[i]
+            matched[skill_id] = min(matched.get(skill_id, 1), self._via_synonym[i])
+
+        top = heapq.nsmallest(
+            limit, matched,
+            key=lambda skill_id: (matched[skill_id], -self.counts[skill_id], self.skills[skill_id])
+        )
+        return tuple((self.skills[skill_id], self.counts[skill_id]) for skill_id in top)
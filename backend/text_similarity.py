@@ -0,0 +1,122 @@
+"""
+Text Similarity Module
+TF-IDF vectors over career descriptions and skills, for ranking careers by
+cosine similarity to a user's free-text skills and interests.
+"""
+
+import math
+import re
+from typing import List, Dict, Any, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from career_store import CareerStore
+from vectorized_scoring import top_positions
+
+# Lowercase words, keeping the symbols of names like "c++", "c#" and "node.js"
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9+#]+)*")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split free text into lowercase terms."""
+    return TOKEN_PATTERN.findall(text.lower()) if isinstance(text, str) else []
+
+
+class TextSimilarityIndex:
+    """
+    L2-normalized TF-IDF vectors of the catalog, stored terms x careers.
+
+    Each career's document is its description plus its required skills.
+    Terms are weighted by raw count times smoothed IDF,
+    log((1 + n) / (1 + df)) + 1, so cosine similarity to a query is a single
+    sparse matrix-vector product that only reads the rows of the query's
+    terms. Everything is computed from the catalog itself; there is no model
+    to download.
+    """
+
+    def __init__(self, store: CareerStore):
+        vocabulary: Dict[str, int] = {}
+        indptr = [0]
+        indices: List[int] = []
+
+        # Skill strings repeat across careers, so tokenize each distinct one once
+        skill_terms = [self._term_ids(tokenize(skill), vocabulary) for skill in store.skills.values]
+        skill_codes = store.skills.codes
+        for position in range(len(store)):
+            indices.extend(self._term_ids(tokenize(store.descriptions[position]), vocabulary))
+            for i in range(store.skill_offsets[position], store.skill_offsets[position + 1]):
+                indices.extend(skill_terms[skill_codes[i]])
+            indptr.append(len(indices))
+
+        num_careers = len(store)
+        matrix = sparse.csr_matrix(
+            (np.ones(len(indices)), np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)),
+            shape=(num_careers, len(vocabulary))
+        )
+        matrix.sum_duplicates()
+
+        document_frequency = np.bincount(matrix.indices, minlength=len(vocabulary))
+        self.idf = np.log((1 + num_careers) / (1 + document_frequency)) + 1.0
+        matrix = matrix.multiply(self.idf).tocsr()
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        self.term_matrix = sparse.csr_matrix((sparse.diags(1.0 / norms) @ matrix).T)
+        self.vocabulary = vocabulary
+
+    def to_arrays(self) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+        """Arrays and JSON-serializable metadata from which from_arrays rebuilds this index."""
+        arrays = {
+            "idf": self.idf,
+            "indptr": self.term_matrix.indptr,
+            "indices": self.term_matrix.indices,
+            "data": self.term_matrix.data,
+        }
+        return arrays, {"terms": list(self.vocabulary), "num_careers": self.term_matrix.shape[1]}
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray], meta: Dict[str, Any]) -> "TextSimilarityIndex":
+        """Index restored from to_arrays output; the matrix views `arrays` without copying."""
+        text_index = cls.__new__(cls)
+        text_index.vocabulary = {term: term_id for term_id, term in enumerate(meta["terms"])}
+        text_index.idf = arrays["idf"]
+        text_index.term_matrix = sparse.csr_matrix(
+            (arrays["data"], arrays["indices"], arrays["indptr"]),
+            shape=(len(meta["terms"]), meta["num_careers"]), copy=False
+        )
+        return text_index
+
+    @staticmethod
+    def _term_ids(terms: List[str], vocabulary: Dict[str, int]) -> List[int]:
+        ids = []
+        for term in terms:
+            term_id = vocabulary.get(term)
+            if term_id is None:
+                term_id = len(vocabulary)
+                vocabulary[term] = term_id
+            ids.append(term_id)
+        return ids
+
+    def query_terms(self, texts: List[str]) -> Tuple[str, ...]:
+        """Sorted catalog terms of a query, with repeats (they weigh the query vector)."""
+        return tuple(sorted(
+            term for text in texts for term in tokenize(text) if term in self.vocabulary
+        ))
+
+    def score(self, terms: Tuple[str, ...]) -> np.ndarray:
+        """Cosine similarity of every career to the query made of `terms`."""
+        if not terms:
+            return np.zeros(self.term_matrix.shape[1])
+
+        counts: Dict[int, int] = {}
+        for term in terms:
+            term_id = self.vocabulary[term]
+            counts[term_id] = counts.get(term_id, 0) + 1
+        term_ids = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+        weights = np.fromiter(counts.values(), dtype=np.float64, count=len(counts)) * self.idf[term_ids]
+        weights /= math.sqrt(float(weights @ weights))
+        return self.term_matrix[term_ids].T @ weights
+
+    def top_k(self, terms: Tuple[str, ...], limit: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Positions and rounded similarities of the `limit` most similar careers."""
+        return top_positions(self.score(terms), limit)
@@ -0,0 +1,196 @@
+"""
+Vectorized Scoring Module
+NumPy scoring backend that evaluates every career with a few array operations.
+"""
+
+from typing import List, Dict, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from career_index import CareerIndex, ScoringInputs
+
+
+def round_scores(scores: np.ndarray, ndigits: int = 3) -> np.ndarray:
+    """
+    Round scores to `ndigits` decimals exactly like Python's round().
+
+    np.round scales and rounds half to even on the scaled value, which can
+    disagree with round() on values within float error of a half, so those
+    few entries are redone in Python.
+    """
+    rounded = np.round(scores, ndigits)
+    scaled = scores * 10 ** ndigits
+    near_half = np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6)
+    for position in near_half:
+        rounded.flat[position] = round(float(scores.flat[position]), ndigits)
+    return rounded
+
+
+def top_positions(scores: np.ndarray, limit: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Positions and rounded scores of the `limit` best careers.
+
+    Ranking is by score rounded to 3 decimals, ties broken by catalog order,
+    i.e. the same as a stable descending sort followed by a slice. Rounding is
+    monotonic, so only scores within rounding distance of the k-th best raw
+    score need to be rounded and compared.
+    """
+    if limit <= 0 or scores.size == 0:
+        return np.empty(0, dtype=np.intp), np.empty(0)
+
+    if limit < scores.size:
+        kth_score = np.partition(scores, scores.size - limit)[scores.size - limit]
+        candidates = np.flatnonzero(scores >= kth_score - 1.5e-3)
+    else:
+        candidates = np.arange(scores.size)
+    rounded = round_scores(scores[candidates])
+
+    if candidates.size > limit:
+        threshold = np.partition(rounded, rounded.size - limit)[rounded.size - limit]
+        above = np.flatnonzero(rounded > threshold)
+        tied = np.flatnonzero(rounded == threshold)[:limit - above.size]
+        keep = np.sort(np.concatenate([above, tied]))
+        candidates, rounded = candidates[keep], rounded[keep]
+
+    order = np.argsort(-rounded, kind="stable")
+    return candidates[order], rounded[order]
+
+
+class VectorizedScorer:
+    """Skill x career matrices and integer feature columns for a range of careers."""
+
+    def __init__(self, arrays: Dict[str, np.ndarray], num_skills: int):
+        """
+        Args:
+            arrays: Arrays produced by build_arrays (possibly views on shared memory)
+            num_skills: Size of the skill vocabulary
+        """
+        self.arrays = arrays
+        self.num_skills = num_skills
+        shape = (num_skills, arrays["skill_totals"].size)
+
+        # Stored skills x careers so a user's matched skills select rows.
+        # Duplicate skills in a career count once per occurrence for exact
+        # matches but only once for partial matches.
+        counts = arrays["skill_counts"]
+        self.skill_counts = sparse.csr_matrix(
+            (counts, arrays["skill_careers"], arrays["skill_indptr"]), shape=shape, copy=False
+        )
+        self.skill_presence = sparse.csr_matrix(
+            (arrays["skill_ones"], arrays["skill_careers"], arrays["skill_indptr"]), shape=shape, copy=False
+        )
+        self.skill_totals = arrays["skill_totals"]
+        self.career_categories = arrays["career_categories"]
+        self.career_experience = arrays["career_experience"]
+
+        # Careers sharing a (category, experience level) pair score the same
+        # unless they match a skill
+        self.career_groups = arrays["career_groups"]
+        self.group_categories = arrays["group_categories"]
+        self.group_experience = arrays["group_experience"]
+
+    @classmethod
+    def from_index(cls, index: CareerIndex, start: int = 0, stop: Optional[int] = None) -> "VectorizedScorer":
+        """Scorer over careers [start, stop) of `index`; positions are relative to start."""
+        return cls(cls.build_arrays(index, start, stop), len(index.skill_names))
+
+    @staticmethod
+    def build_arrays(index: CareerIndex, start: int = 0, stop: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Plain NumPy arrays backing a scorer over careers [start, stop) of `index`."""
+        stop = len(index) if stop is None else stop
+        num_careers = stop - start
+        num_skills = len(index.skill_names)
+
+        offsets = np.asarray(index.skill_offsets[start:stop + 1], dtype=np.int64)
+        indices = np.asarray(index.skill_ids[offsets[0]:offsets[-1]], dtype=np.int64)
+        indptr = offsets - offsets[0]
+        counts = sparse.csr_matrix(
+            (np.ones(indices.size), indices, indptr), shape=(num_careers, num_skills)
+        )
+        counts.sum_duplicates()
+        skill_major = counts.T.tocsr()
+        index_dtype = np.int32 if skill_major.nnz < 2 ** 31 else np.int64
+
+        career_categories = np.asarray(index.career_categories[start:stop], dtype=np.int64)
+        career_experience = np.asarray(index.career_experience[start:stop], dtype=np.int64)
+        num_levels = max(len(index.experience_levels), 1)
+        num_groups = max(len(index.categories), 1) * num_levels
+
+        return {
+            "skill_indptr": skill_major.indptr.astype(index_dtype),
+            "skill_careers": skill_major.indices.astype(index_dtype),
+            "skill_counts": skill_major.data,
+            "skill_ones": np.ones_like(skill_major.data),
+            "skill_totals": np.diff(indptr).astype(np.float64),
+            "career_categories": career_categories,
+            "career_experience": career_experience,
+            "career_groups": career_categories * num_levels + career_experience,
+            "group_categories": np.arange(num_groups) // num_levels,
+            "group_experience": np.arange(num_groups) % num_levels,
+        }
+
+    def top_k_batch(self, inputs_list: List[ScoringInputs], limit: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """Positions and rounded scores of the best `limit` careers for each user."""
+        return [top_positions(scores, limit) for scores in self.score_batch(inputs_list)]
+
+    def score(self, inputs: ScoringInputs) -> np.ndarray:
+        """Final (unrounded) match score of every career for one user."""
+        return self.score_batch([inputs])[0]
+
+    def score_batch(self, inputs_list: List[ScoringInputs]) -> np.ndarray:
+        """
+        Final match scores for several users at once.
+
+        Careers with no matched skill score only on their (category, experience
+        level) group, so every user starts from a gather of per-group scores.
+        The users x skills match matrices are then multiplied against the
+        skills x careers matrices, which only touches careers in the posting
+        lists of matched skills, and those entries are rescored.
+
+        Returns:
+            users x careers array of final, unrounded scores
+        """
+        num_users = len(inputs_list)
+        interest = np.array([inputs.interest_scores for inputs in inputs_list], dtype=np.float64)
+        bonus = np.array([inputs.category_bonuses for inputs in inputs_list], dtype=np.float64)
+        experience = np.array([inputs.experience_bonuses for inputs in inputs_list], dtype=np.float64)
+
+        group_scores = (
+            0.0 * 0.6 +
+            interest[:, self.group_categories] * 0.3 +
+            experience[:, self.group_experience] +
+            bonus[:, self.group_categories]
+        )
+        np.clip(group_scores, 0.0, 1.0, out=group_scores)
+        final_score = np.take(group_scores, self.career_groups, axis=1)
+
+        exact_rows, exact_cols, partial_rows, partial_cols = [], [], [], []
+        for row, inputs in enumerate(inputs_list):
+            for skill_id in inputs.related_counts:
+                if skill_id in inputs.exact_ids:
+                    exact_rows.append(row)
+                    exact_cols.append(skill_id)
+                else:
+                    partial_rows.append(row)
+                    partial_cols.append(skill_id)
+        shape = (num_users, self.num_skills)
+        exact = sparse.csr_matrix((np.ones(len(exact_rows)), (exact_rows, exact_cols)), shape=shape)
+        partial = sparse.csr_matrix((np.ones(len(partial_rows)), (partial_rows, partial_cols)), shape=shape)
+
+        matched = (exact @ self.skill_counts + partial @ self.skill_presence).tocsr()
+        rows = np.repeat(np.arange(num_users), np.diff(matched.indptr))
+        cols = matched.indices
+        if cols.size:
+            categories = self.career_categories[cols]
+            skill_score = matched.data / self.skill_totals[cols]
+            scores = (
+                skill_score * 0.6 +
+                interest[rows, categories] * 0.3 +
+                experience[rows, self.career_experience[cols]] +
+                bonus[rows, categories]
+            )
+            np.clip(scores, 0.0, 1.0, out=scores)
+            final_score[rows, cols] = scores
+
+        return final_score